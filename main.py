@@ -8,7 +8,7 @@ import sys
 import os
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QPushButton, QLabel, QStackedWidget, QMessageBox
 from PySide6.QtCore import Qt, QTimer, QSize
-from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap
+from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QPixmap, QPixmapCache
 
 from src.ui.theme import apply_global_theme
 from src.main import DoroLexusApp
@@ -20,6 +20,8 @@ def main():
     app.setApplicationName("DoroLexus")
     app.setApplicationVersion("1.0.0")
     apply_global_theme(app)
+    # Shared icon rasters live in QPixmapCache; leave room beside Qt's own style caching
+    QPixmapCache.setCacheLimit(20 * 1024)
     
     # Create and show main window
     window = DoroLexusApp()
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 
 
@@ -10,6 +11,7 @@ def project_root() -> str:
     return os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 
 
+@lru_cache(maxsize=256)
 def asset_path(*parts: str) -> Optional[str]:
     """Resolve an asset path by trying common bases.
 
@@ -17,7 +19,8 @@ def asset_path(*parts: str) -> Optional[str]:
     1) project_root()/
     2) project_root()/src/
     3) directory of caller module (best-effort using this file as reference)
-    Returns absolute path if found, else None.
+    Returns absolute path if found, else None. Results are cached, since
+    callers pass constant parts and assets don't move at runtime.
     """
     candidates = [
         os.path.join(project_root(), *parts),
@@ -0,0 +1,343 @@
+"""
+Stylesheet constants shared by the widget modules
+
+Every stylesheet here is built once at import. Templates carry a
+{font_family} placeholder; pass them through theme.mono_qss() before use.
+"""
+
+from functools import lru_cache
+
+from .theme import PRIMARY_COLOR, DANGER_COLOR
+
+
+# Button variants, matched by object name (see src/widgets/button_widget.py).
+# Page stylesheets outrank the application sheet, so each button installs its
+# own variant rather than relying on DARK_STYLESHEET.
+BTN_PRIMARY_QSS = f"""
+    QPushButton#primary {{
+        background-color: {PRIMARY_COLOR};
+        color: #FFFFFF;
+        border: 1px solid #2D333B;
+        padding: 10px 20px;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        font-family: {{font_family}};
+    }}
+    QPushButton#primary:hover {{ background-color: #2A7FFF; }}
+    QPushButton#primary:pressed {{ background-color: #1964D0; }}
+"""
+
+BTN_DANGER_QSS = f"""
+    QPushButton#danger {{
+        background-color: {DANGER_COLOR};
+        color: #FFFFFF;
+        border: 1px solid #7A1C23;
+        padding: 10px 20px;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        font-family: {{font_family}};
+    }}
+    QPushButton#danger:hover {{ background-color: #b02a37; }}
+    QPushButton#danger:pressed {{ background-color: #9a2430; }}
+"""
+
+BTN_ICON_TEXT_QSS = """
+    QPushButton#icontext {
+        background-color: #1E1E1E;
+        color: #E0E0E0;
+        border: 1px solid #2D2D2D;
+        padding: 10px 16px;
+        border-radius: 8px;
+        font-size: 14px;
+        text-align: left;
+        font-family: {font_family};
+    }
+    QPushButton#icontext:hover { background-color: #2A2A2A; }
+    QPushButton#icontext:pressed { background-color: #252525; }
+"""
+
+BTN_SECONDARY_QSS = """
+    QPushButton#secondary {
+        background-color: transparent;
+        color: #E0E0E0;
+        border: 1px solid #444444;
+        padding: 10px 20px;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        font-family: {font_family};
+    }
+    QPushButton#secondary:hover { 
+        background-color: rgba(255, 255, 255, 0.1);
+        border-color: #666666;
+    }
+    QPushButton#secondary:pressed { 
+        background-color: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+BTN_COMPACT_QSS = f"""
+    QPushButton#compact {{
+        background-color: {PRIMARY_COLOR};
+        color: #FFFFFF;
+        border: none;
+        padding: 6px 12px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+        font-family: {{font_family}};
+    }}
+    QPushButton#compact:hover {{ background-color: #2A7FFF; }}
+    QPushButton#compact:pressed {{ background-color: #1964D0; }}
+"""
+
+
+# CompactStudyMenuWidget and all of its children; set once on the menu so each
+# mode/action button doesn't carry its own copy
+STUDY_MENU_QSS = """
+    CompactStudyMenuWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(20, 20, 26, 0.98),
+            stop:1 rgba(10, 10, 16, 0.98));
+        border: 2px solid rgba(255, 107, 107, 0.6);
+        border-radius: 16px;
+    }
+    QLabel#menuTitle {
+        color: #ff6b6b;
+        font-size: 16px;
+        font-weight: bold;
+        font-family: {font_family};
+        background: transparent;
+    }
+    QLabel#deckInfo {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 11px;
+        font-family: {font_family};
+        background: transparent;
+    }
+    CompactStudyModeButton {
+        background: rgba(40, 40, 50, 0.9);
+        color: #ff6b6b;
+        border: 2px solid rgba(255, 107, 107, 0.4);
+        border-radius: 12px;
+        padding: 10px 18px;
+        font-size: 13px;
+        font-weight: 800;
+        letter-spacing: 0.4px;
+        font-family: {font_family};
+        text-align: center;
+    }
+    CompactStudyModeButton:hover {
+        background: rgba(60, 60, 70, 0.95);
+        border: 2px solid rgba(255, 107, 107, 0.8);
+        color: #ffffff;
+    }
+    CompactStudyModeButton:pressed {
+        background: rgba(20, 20, 30, 0.95);
+        border: 2px solid rgba(255, 150, 150, 0.9);
+        color: #ffdddd;
+    }
+    CompactStudyModeButton:disabled {
+        background: rgba(50, 50, 50, 0.5);
+        color: rgba(255, 255, 255, 0.3);
+        border: 2px solid rgba(255, 255, 255, 0.1);
+    }
+    CompactStudyModeButton[active="true"] {
+        background: rgba(255, 99, 71, 0.9);
+        color: #ffffff;
+        border: 2px solid rgba(255, 150, 150, 0.8);
+        font-weight: 900;
+        letter-spacing: 0.5px;
+    }
+    CompactStudyModeButton[active="true"]:hover {
+        background: rgba(255, 99, 71, 1.0);
+        border: 2px solid rgba(255, 200, 200, 1.0);
+    }
+    QPushButton#cancel {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(210, 60, 76, 0.95),
+            stop:1 rgba(180, 30, 40, 0.95));
+        color: #ffffff;
+        border: 2px solid rgba(255, 120, 140, 0.85);
+        border-radius: 10px;
+        padding: 6px 14px;
+        font-size: 12px;
+        font-weight: 700;
+        letter-spacing: 0.3px;
+        font-family: {font_family};
+    }
+    QPushButton#cancel:hover {
+        border-color: rgba(255, 160, 170, 0.95);
+    }
+    QPushButton#cancel:pressed {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(170, 30, 40, 0.95),
+            stop:1 rgba(140, 20, 28, 0.95));
+    }
+    QPushButton#start {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 rgba(255, 230, 100, 0.98),
+            stop:1 rgba(255, 205, 60, 0.98));
+        color: #2b2b2b;
+        border: 2px solid rgba(255, 240, 160, 0.95);
+        border-radius: 12px;
+        padding: 6px 16px;
+        font-size: 14px;
+        font-weight: 800;
+        letter-spacing: 0.5px;
+        font-family: {font_family};
+    }
+    QPushButton#start:hover { 
+        border-color: rgba(255, 250, 180, 1.0);
+    }
+    QPushButton#start:disabled {
+        background: rgba(120, 120, 120, 0.35);
+        color: rgba(255,255,255,0.4);
+        border: 2px solid rgba(255,255,255,0.2);
+    }
+"""
+
+
+# Deck card backgrounds: a vertical gradient plus border, and a hover variant
+_CARD_GRADIENT_QSS = """
+    {cls} {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {top},
+            stop:1 {bottom});
+        border-radius: 12px;
+        border: {border};
+    }}
+    {cls}:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {hover_top},
+            stop:1 {hover_bottom});
+        border: {hover_border};
+    }}
+"""
+
+
+def _card_gradient_qss(cls, top, bottom, hover_top, hover_bottom,
+                       border="none", hover_border=None):
+    """Fill _CARD_GRADIENT_QSS for one card selector"""
+    return _CARD_GRADIENT_QSS.format(
+        cls=cls, top=top, bottom=bottom, border=border,
+        hover_top=hover_top, hover_bottom=hover_bottom,
+        hover_border=hover_border or border)
+
+
+_CARD_TOP = "rgba(60, 60, 60, 0.9)"
+_CARD_BOTTOM = "rgba(40, 40, 40, 0.9)"
+
+# Deck cards (src/widgets/deck_card_widgets.py); installed once on the
+# DeckGalleryWidget so repopulating the gallery doesn't re-parse a sheet per card
+DECK_CARD_QSS = (
+    _card_gradient_qss(
+        "CreateDeckCardWidget",
+        "rgba(100, 200, 100, 0.3)", "rgba(60, 160, 60, 0.3)",
+        "rgba(120, 220, 120, 0.4)", "rgba(80, 180, 80, 0.4)",
+        border="2px dashed rgba(100, 200, 100, 0.6)",
+        hover_border="2px dashed rgba(120, 220, 120, 0.8)")
+    + _card_gradient_qss(
+        "StudyDeckCardWidget",
+        _CARD_TOP, _CARD_BOTTOM,
+        "rgba(45, 45, 50, 0.95)", "rgba(25, 25, 30, 0.95)")
+    + _card_gradient_qss(
+        'StudyDeckCardWidget[selected="true"]',
+        "rgba(20, 20, 25, 0.95)", "rgba(10, 10, 15, 0.95)",
+        "rgba(30, 30, 35, 0.95)", "rgba(15, 15, 20, 0.95)")
+    + _card_gradient_qss(
+        "ManagementDeckCardWidget",
+        _CARD_TOP, _CARD_BOTTOM,
+        "rgba(80, 80, 80, 0.9)", "rgba(60, 60, 60, 0.9)")
+    + _card_gradient_qss(
+        "SelectionDeckCardWidget",
+        _CARD_TOP, _CARD_BOTTOM,
+        "rgba(80, 80, 80, 0.9)", "rgba(60, 60, 60, 0.9)",
+        border="2px solid transparent",
+        hover_border="2px solid rgba(100, 150, 255, 0.6)")
+    + """
+    StudyDeckCardWidget QLabel#sword {
+        background: transparent;
+        border: none;
+    }
+    ManagementDeckCardWidget QLabel#deckName {
+        color: white;
+        font-size: 14px;
+        font-weight: bold;
+        background: transparent;
+        font-family: {font_family};
+    }
+    ManagementDeckCardWidget QLabel#deckCount {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 11px;
+        background: transparent;
+        font-family: {font_family};
+    }
+    SelectionDeckCardWidget QLabel#deckName {
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+        background: transparent;
+        font-family: {font_family};
+    }
+    SelectionDeckCardWidget QLabel#deckCount {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 12px;
+        background: transparent;
+        font-family: {font_family};
+    }
+""")
+
+
+# Study modes as (type, title, description, icon, color)
+STUDY_MODES = (
+    ("review", "Review", "Study with spaced repetition algorithm", "🧠", "#64c8ff"),
+    ("test", "Test Mode", "Quiz yourself without revealing answers", "✏️", "#ff6b6b"),
+    ("browse", "Browse Cards", "Go through cards at your own pace", "📖", "#66bb6a"),
+    ("cram", "Cram Session", "Quick review of all cards", "⚡", "#ffa726"),
+    ("new_only", "New Cards", "Study only new, unseen cards", "✨", "#ab47bc"),
+    ("difficult", "Difficult Cards", "Focus on cards you find challenging", "🎯", "#f44336"),
+)
+
+# Study mode cards (src/ui/study_mode_selection_layout.py and
+# src/widgets/study_mode_menu_widget.py); only the accent color varies between cards
+STUDY_MODE_CARD_QSS = """
+    StudyModeCard {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(60, 60, 60, 0.9),
+            stop:1 rgba(40, 40, 40, 0.9));
+        border-radius: 16px;
+        border: 2px solid rgba(255, 255, 255, 0.1);
+    }}
+    StudyModeCard:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(80, 80, 80, 0.9),
+            stop:1 rgba(60, 60, 60, 0.9));
+        border: 2px solid {color};
+    }}
+    StudyModeCard QLabel#icon {{
+        color: {color};
+        font-size: 48px;
+        background: transparent;
+        font-family: "Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji";
+    }}
+    StudyModeCard QLabel#title {{
+        color: {color};
+        font-size: 18px;
+        font-weight: bold;
+        background: transparent;
+    }}
+    StudyModeCard QLabel#description {{
+        color: rgba(255, 255, 255, 0.8);
+        font-size: 12px;
+        background: transparent;
+    }}
+"""
+
+
+@lru_cache(maxsize=8)
+def study_mode_card_qss(color):
+    """Stylesheet for a study mode card with the given accent color"""
+    return STUDY_MODE_CARD_QSS.format(color=color)
@@ -7,7 +7,7 @@ from typing import List, Tuple
 from PySide6.QtGui import QColor
 
 
-@dataclass
+@dataclass(frozen=True)
 class MenuCardConfig:
     """Configuration for menu cards"""
     
@@ -44,9 +44,12 @@ class MenuCardConfig:
     # Hover effects
     hover_lighten_factor: float = 0.1
     press_darken_factor: float = 0.1
+    
+    # Drop shadow, painted by the parent menu; turn off on slow machines
+    enable_shadow: bool = True
 
 
-@dataclass
+@dataclass(frozen=True)
 class MiniCardConfig:
     """Configuration for mini cards"""
     
@@ -78,6 +81,9 @@ class MiniCardConfig:
     # Hover effects
     hover_lighten_factor: float = 0.1
     press_darken_factor: float = 0.1
+    
+    # Drop shadow, painted by the parent menu; turn off on slow machines
+    enable_shadow: bool = True
 
 
 @dataclass
@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                QScrollArea, QGraphicsDropShadowEffect)
 from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QTimer, QRect, QPoint
 from PySide6.QtGui import QColor
-from src.widgets.responsive_deck_card_widget import ResponsiveDeckCardWidget
+from src.widgets.responsive_deck_card_widget import ResponsiveDeckCardWidget, prewarm_card_artwork
 from src.ui.responsive_grid_layout import ResponsiveGridLayout
 
 
@@ -29,6 +29,8 @@ class ResponsiveDeckGalleryLayout(QWidget):
         self._typing_index = 0
         self._is_visible = False
         self.init_ui()
+        # The card swords rasterize on the thread pool while the gallery fills
+        prewarm_card_artwork()
         # Don't start animation immediately - wait for show event
         
     def init_ui(self):
@@ -119,9 +121,10 @@ class ResponsiveDeckGalleryLayout(QWidget):
     def resizeEvent(self, event):
         """Handle resize events to update grid layout"""
         super().resizeEvent(event)
-        # Trigger grid layout recalculation when the gallery is resized
+        # Lay the grid out against the scroll viewport, which is the width
+        # actually available to cards (excludes the vertical scrollbar)
         if hasattr(self, 'deck_cards_layout') and self.deck_cards_layout:
-            self.deck_cards_layout._recalculate_layout()
+            self.deck_cards_layout.set_viewport_width(self.scroll_area.viewport().width())
         
     def refresh_decks(self, decks):
         """Refresh the deck gallery with new deck data"""
@@ -158,10 +161,9 @@ class ResponsiveDeckGalleryLayout(QWidget):
             deck_card.deck_selected.connect(self.deck_selected.emit)
             deck_card.preview_requested.connect(self.preview_requested.emit)
             self.deck_cards.append(deck_card)
-            self.deck_cards_layout.add_card(deck_card)
         
-        # Force layout update
-        self.deck_cards_layout._recalculate_layout()
+        # Place all cards in one layout pass
+        self.deck_cards_layout.add_cards(self.deck_cards)
         
     def clear_selection(self):
         """Clear all deck selections"""
@@ -17,6 +17,7 @@ class ResponsiveGridLayout(QWidget):
         self.card_height = 120
         self.spacing = 20
         self.margin = 20
+        self._viewport_width = 0
         
         # Resize timer for debouncing
         self.resize_timer = QTimer()
@@ -39,6 +40,17 @@ class ResponsiveGridLayout(QWidget):
         card_widget.setParent(self)
         self._recalculate_layout()
         
+    def add_cards(self, cards):
+        """Add several deck cards to the grid with a single layout pass"""
+        for card in cards:
+            self.cards.append(card)
+            card.setParent(self)
+        self._last_card_count = None  # Positions must be recomputed
+        self._recalculate_layout()
+        # Reparenting hides a widget; show new cards once they are in place
+        for card in cards:
+            card.show()
+        
     def remove_card(self, card_widget):
         """Remove a deck card from the grid"""
         if card_widget in self.cards:
@@ -56,6 +68,31 @@ class ResponsiveGridLayout(QWidget):
         self.cards.clear()
         self._recalculate_layout()
         
+    def set_cards(self, cards):
+        """Replace the grid's cards, leaving cards that stay in place attached"""
+        keep = set(cards)
+        for card in self.cards:
+            if card not in keep:
+                if hasattr(card, 'reset_position'):
+                    card.reset_position()
+                card.setParent(None)
+        added = [card for card in cards if card.parent() is not self]
+        for card in added:
+            card.setParent(self)
+        self.cards = list(cards)
+        self._last_card_count = None  # Positions must be recomputed
+        self._recalculate_layout()
+        # Reparenting hides a widget; show new cards once they are in place
+        for card in added:
+            card.show()
+        
+    def set_viewport_width(self, width):
+        """Set the width of the enclosing scroll viewport used for layout"""
+        if width == self._viewport_width:
+            return
+        self._viewport_width = width
+        self._recalculate_layout()
+        
     def resizeEvent(self, event):
         """Handle resize events with debouncing"""
         super().resizeEvent(event)
@@ -69,8 +106,9 @@ class ResponsiveGridLayout(QWidget):
         if not self.cards:
             return
             
-        # Get available width - use parent width if we don't have a width yet
-        widget_width = self.width()
+        # Get available width - prefer the scroll viewport width, then our own,
+        # then the parent's if we don't have a width yet
+        widget_width = self._viewport_width or self.width()
         if widget_width <= 0 and self.parent():
             widget_width = self.parent().width()
         if widget_width <= 0:
@@ -105,8 +143,11 @@ class ResponsiveGridLayout(QWidget):
                 current_x = start_x
                 row_count += 1
                 
-            # Position the card
-            card.move(QPoint(current_x, current_y))
+            # Position the card and tell it where it rests (for hover jumps)
+            pos = QPoint(current_x, current_y)
+            card.move(pos)
+            if hasattr(card, 'set_home_pos'):
+                card.set_home_pos(pos)
             current_x += self.card_width + self.spacing
             
         # Update the widget's minimum size
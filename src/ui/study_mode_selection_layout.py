@@ -7,6 +7,7 @@ from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QFont, QIcon
 from ..widgets.button_widget import PrimaryButtonWidget
+from ._qss import STUDY_MODES, study_mode_card_qss
 
 
 class StudyModeCard(QFrame):
@@ -27,21 +28,7 @@ class StudyModeCard(QFrame):
         """Initialize the study mode card UI"""
         self.setFixedSize(280, 160)
         self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet(f"""
-            StudyModeCard {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(60, 60, 60, 0.9),
-                    stop:1 rgba(40, 40, 40, 0.9));
-                border-radius: 16px;
-                border: 2px solid rgba(255, 255, 255, 0.1);
-            }}
-            StudyModeCard:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(80, 80, 80, 0.9),
-                    stop:1 rgba(60, 60, 60, 0.9));
-                border: 2px solid {self.color};
-            }}
-        """)
+        self.setStyleSheet(study_mode_card_qss(self.color))
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -50,42 +37,20 @@ class StudyModeCard(QFrame):
         # Icon
         icon_label = QLabel(self.icon_text)
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.color};
-                font-size: 48px;
-                background: transparent;
-                font-family: "Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji";
-            }}
-        """)
+        icon_label.setObjectName("icon")
         layout.addWidget(icon_label)
         
         # Title
         title_label = QLabel(self.title)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.color};
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }}
-        """)
+        title_label.setObjectName("title")
         layout.addWidget(title_label)
         
         # Description
         desc_label = QLabel(self.description)
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        desc_label.setObjectName("description")
         layout.addWidget(desc_label)
         
     def mousePressEvent(self, event):
@@ -134,7 +99,6 @@ class StudyModeSelectionLayout(QWidget):
                 font-size: 28px;
                 font-weight: bold;
                 background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
                 margin: 20px 0px;
             }
         """)
@@ -148,7 +112,6 @@ class StudyModeSelectionLayout(QWidget):
                 color: rgba(255, 255, 255, 0.7);
                 font-size: 16px;
                 background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
             }
         """)
         header_layout.addWidget(self.deck_info)
@@ -164,7 +127,6 @@ class StudyModeSelectionLayout(QWidget):
                 font-size: 22px;
                 font-weight: bold;
                 background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
                 margin: 10px 0px;
             }
         """)
@@ -175,61 +137,9 @@ class StudyModeSelectionLayout(QWidget):
         modes_layout.setSpacing(20)
         modes_layout.setAlignment(Qt.AlignCenter)
         
-        # Define study modes
-        study_modes = [
-            {
-                "type": "review",
-                "title": "Review",
-                "description": "Study with spaced repetition algorithm",
-                "icon": "🧠",
-                "color": "#64c8ff"
-            },
-            {
-                "type": "test",
-                "title": "Test Mode", 
-                "description": "Quiz yourself without revealing answers",
-                "icon": "✏️",
-                "color": "#ff6b6b"
-            },
-            {
-                "type": "browse",
-                "title": "Browse Cards",
-                "description": "Go through cards at your own pace",
-                "icon": "📖",
-                "color": "#66bb6a"
-            },
-            {
-                "type": "cram",
-                "title": "Cram Session",
-                "description": "Quick review of all cards",
-                "icon": "⚡",
-                "color": "#ffa726"
-            },
-            {
-                "type": "new_only",
-                "title": "New Cards",
-                "description": "Study only new, unseen cards",
-                "icon": "✨",
-                "color": "#ab47bc"
-            },
-            {
-                "type": "difficult",
-                "title": "Difficult Cards",
-                "description": "Focus on cards you find challenging",
-                "icon": "🎯",
-                "color": "#f44336"
-            }
-        ]
-        
         # Create mode cards
-        for i, mode in enumerate(study_modes):
-            mode_card = StudyModeCard(
-                mode["type"],
-                mode["title"], 
-                mode["description"],
-                mode["icon"],
-                mode["color"]
-            )
+        for i, (mode_type, title, description, icon, color) in enumerate(STUDY_MODES):
+            mode_card = StudyModeCard(mode_type, title, description, icon, color)
             mode_card.mode_selected.connect(self.mode_selected.emit)
             
             row = i // 3
@@ -1,19 +1,27 @@
+from functools import lru_cache
+from typing import Optional
+
 from PySide6.QtGui import QFont
 
+# Monospace families in order of preference, and the matching CSS fallback list
+MONO_FAMILIES = ("Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New")
+MONO_FAMILY_STACK = ", ".join(f'"{family}"' for family in MONO_FAMILIES) + ", monospace"
+
+# Pass through mono_qss() to fill in the font family
 DARK_STYLESHEET = """
     QWidget { 
         background-color: #121212; 
         color: #E0E0E0; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QMainWindow { 
         background-color: rgba(18,18,18,230); 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QLabel { 
         color: #E0E0E0; 
         font-size: 14px; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QPushButton {
         background-color: #1F6FEB;
@@ -23,7 +31,7 @@ DARK_STYLESHEET = """
         border-radius: 6px;
         font-size: 14px;
         font-weight: bold;
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QPushButton:hover { background-color: #2A7FFF; }
     QPushButton:pressed { background-color: #1964D0; }
@@ -31,7 +39,7 @@ DARK_STYLESHEET = """
         background-color: #1E1E1E; 
         border: 1px solid #2D2D2D; 
         border-radius: 10px; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QComboBox, QLineEdit, QTextEdit {
         background-color: #1E1E1E;
@@ -39,12 +47,12 @@ DARK_STYLESHEET = """
         border: 1px solid #2D2D2D;
         border-radius: 6px;
         padding: 6px 10px;
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QListWidget { 
         background-color: #151515; 
         border: 1px solid #2D2D2D; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QProgressBar {
         border: 1px solid #2D2D2D;
@@ -52,7 +60,7 @@ DARK_STYLESHEET = """
         text-align: center;
         color: #E0E0E0;
         background-color: #1E1E1E;
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QProgressBar::chunk { background-color: #2EA043; }
     QHeaderView::section { 
@@ -60,13 +68,13 @@ DARK_STYLESHEET = """
         color: #E0E0E0; 
         border: none; 
         border-bottom: 1px solid #2D2D2D; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
     QTableWidget { 
         background-color: #151515; 
         color: #E0E0E0; 
         gridline-color: #2D2D2D; 
-        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        font-family: {font_family};
     }
 """
 
@@ -76,14 +84,51 @@ SUCCESS_COLOR = "#2EA043"
 WARNING_COLOR = "#E3B341"
 TEXT_COLOR = "#E0E0E0"
 
+_MONO_FONT = None
+# Family name of the first installed monospace font, or None if none matched
+RESOLVED_MONO_FAMILY: Optional[str] = None
+
+
+def resolve_mono_font() -> QFont:
+    """Return the app's monospace font, resolving the family only once.
+
+    Needs a running QApplication for the font database lookup.
+    """
+    global _MONO_FONT, RESOLVED_MONO_FAMILY
+    if _MONO_FONT is None:
+        font = QFont(MONO_FAMILIES[0], 11)
+        matched = font.exactMatch()
+        if not matched:
+            for family in MONO_FAMILIES[1:] + ("Monospace",):
+                test = QFont(family, 11)
+                if test.exactMatch():
+                    font = test
+                    matched = True
+                    break
+        _MONO_FONT = font
+        RESOLVED_MONO_FAMILY = font.family() if matched else None
+    return QFont(_MONO_FONT)
+
+
+@lru_cache(maxsize=None)
+def _format_qss(template: str, family: Optional[str]) -> str:
+    if family:
+        font_family = f'"{family}"'
+    else:
+        # Nothing resolved; let Qt walk the fallback list
+        font_family = MONO_FAMILY_STACK
+    return template.replace("{font_family}", font_family)
+
+
+def mono_qss(template: str) -> str:
+    """Fill the ``{font_family}`` placeholder of a stylesheet template.
+
+    Uses the single resolved monospace family so Qt doesn't walk the whole
+    fallback list per widget. Formatted stylesheets are cached per template.
+    """
+    return _format_qss(template, RESOLVED_MONO_FAMILY)
+
 
 def apply_global_theme(app):
-    font = QFont("Cascadia Code", 11)
-    if not font.exactMatch():
-        for family in ["Cascadia Mono", "Fira Code", "Consolas", "Courier New", "Monospace"]:
-            test = QFont(family, 11)
-            if test.exactMatch():
-                font = test
-                break
-    app.setFont(font)
-    app.setStyleSheet(DARK_STYLESHEET)
+    app.setFont(resolve_mono_font())
+    app.setStyleSheet(mono_qss(DARK_STYLESHEET))
@@ -1,29 +1,35 @@
 # Widgets package for DoroLexus - All reusable widget components
+#
+# Widgets are imported lazily on first attribute access (PEP 562), so touching
+# one widget doesn't load every widget module and its Qt dependencies.
 
-# Main widget components
-from .welcome_banner_widget import WelcomeBannerWidget
-from .vertical_menu_widget import VerticalMenuWidget
-from .nav_menu_widget import NavMenuWidget
+import importlib
 
-# Card widgets
-from .menu_card_widget import MenuCardWidget
-from .mini_card_widget import MiniCardWidget
+_LAZY = {
+    # Main widget components
+    'WelcomeBannerWidget': '.welcome_banner_widget',
+    'VerticalMenuWidget': '.vertical_menu_widget',
+    'NavMenuWidget': '.nav_menu_widget',
 
-# Button widgets
-from .button_widget import (
-    PrimaryButtonWidget,
-    DangerButtonWidget,
-    IconTextButtonWidget,
-    SecondaryButtonWidget,
-    CompactButtonWidget
-)
+    # Card widgets
+    'MenuCardWidget': '.menu_card_widget',
+    'MiniCardWidget': '.mini_card_widget',
+
+    # Button widgets
+    'PrimaryButtonWidget': '.button_widget',
+    'DangerButtonWidget': '.button_widget',
+    'IconTextButtonWidget': '.button_widget',
+    'SecondaryButtonWidget': '.button_widget',
+    'CompactButtonWidget': '.button_widget',
 
-# Flashcard widget
-from .flashcard_widget import FlashcardWidget
-from .homepage_button import HomepageButton
+    # Flashcard widget
+    'FlashcardWidget': '.flashcard_widget',
+    'RatingBar': '.flashcard_widget',
+    'HomepageButton': '.homepage_button',
 
-# Responsive deck card widget
-from .responsive_deck_card_widget import ResponsiveDeckCardWidget
+    # Responsive deck card widget
+    'ResponsiveDeckCardWidget': '.responsive_deck_card_widget',
+}
 
 __all__ = [
     # Main widgets
@@ -34,7 +40,21 @@ __all__ = [
     'PrimaryButtonWidget', 'DangerButtonWidget', 'IconTextButtonWidget',
     'SecondaryButtonWidget', 'CompactButtonWidget',
     # Existing widgets
-    'FlashcardWidget', 'HomepageButton',
+    'FlashcardWidget', 'RatingBar', 'HomepageButton',
     # Responsive widgets
     'ResponsiveDeckCardWidget'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,110 @@
+"""
+Base class for the clickable menu and navigation cards
+"""
+
+from functools import lru_cache
+
+from PySide6.QtWidgets import QFrame
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QFont
+from ._card_shadow import paint_card_shadow
+from ._color_utils import lighten, darken
+
+
+# Stylesheets and fonts are built once per distinct color/config and shared between cards.
+# Child labels are styled by descendant rules on the card's one stylesheet, found by object name.
+_TRANSPARENT_RULES = "background: transparent; border: none; outline: none;"
+
+
+@lru_cache(maxsize=8)
+def _label_font(point_size, family, bold=False):
+    """Label font for the given size and family, shared between cards"""
+    font = QFont()
+    font.setPointSize(point_size)
+    if bold:
+        font.setBold(True)
+    font.setFamily(family)
+    return font
+
+
+@lru_cache(maxsize=16)
+def _card_qss(selector, margin, color, border_radius, border_width, border_color,
+              hover_border_color, hover_lighten_factor, press_darken_factor, child_rules=""):
+    """Card stylesheet for one card class, color and border configuration, plus its children"""
+    return f"""
+        {selector} {{
+            background: {color};
+            border-radius: {border_radius}px;
+            border: {border_width}px solid {border_color};
+            margin: {margin}px 0px;
+            outline: none;
+        }}
+        {selector}:hover {{
+            background: {lighten(color, hover_lighten_factor)};
+            border: {border_width}px solid {hover_border_color};
+        }}
+        {selector}:pressed {{
+            background: {darken(color, press_darken_factor)};
+        }}
+    """ + child_rules
+
+
+@lru_cache(maxsize=4)
+def _title_qss(selector, color):
+    """Rule for the card's title label"""
+    return f"""
+        {selector} QLabel#cardTitle {{
+            color: {color};
+            background: transparent;
+            border: none;
+            outline: none;
+            padding: 0px;
+            margin: 0px;
+            font-weight: 600;
+        }}
+    """
+
+
+class BaseCardWidget(QFrame):
+    """Colored card that emits clicked and leaves its drop shadow to the parent"""
+    clicked = Signal()
+
+    # Subclasses set their config class, stylesheet margin and shadow style
+    config_class = None
+    card_margin = 0
+    shadow_blur = 0
+    shadow_offset = (0, 0)
+    shadow_alpha = 0
+
+    def __init__(self, title: str, icon_name: str, color: str, config=None, parent=None):
+        super().__init__(parent)
+        self.title = title
+        self.icon_name = icon_name
+        self.color = color
+        self.config = config or self.config_class()
+
+    def _apply_card_style(self, child_rules=""):
+        """Size the card and give it the one stylesheet for itself and its children"""
+        cfg = self.config
+        self.setFixedHeight(cfg.height)
+        self.setFixedWidth(cfg.width)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setStyleSheet(_card_qss(type(self).__name__, self.card_margin, self.color,
+                                     cfg.border_radius, cfg.border_width, cfg.border_color,
+                                     cfg.hover_border_color, cfg.hover_lighten_factor,
+                                     cfg.press_darken_factor, child_rules))
+
+    def paint_shadow(self, painter):
+        """Paint the card's drop shadow using its parent's painter"""
+        if not self.config.enable_shadow:
+            return
+        # The background sits inside the vertical stylesheet margin
+        margin = self.card_margin
+        rect = self.geometry().adjusted(0, margin, 0, -margin)
+        paint_card_shadow(painter, rect, self.config.border_radius,
+                          self.shadow_blur, self.shadow_offset, self.shadow_alpha)
+
+    def mousePressEvent(self, event):
+        """Handle mouse click"""
+        self.clicked.emit()
+        super().mousePressEvent(event)
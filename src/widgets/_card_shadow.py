@@ -0,0 +1,71 @@
+"""
+Card drop shadows - one small blurred tile per style, stretched to any card size
+"""
+
+from functools import lru_cache
+
+from PySide6.QtWidgets import QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PySide6.QtGui import QImage, QPainter, QColor, QPixmap
+from PySide6.QtCore import Qt, QRect, QRectF
+
+
+@lru_cache(maxsize=8)
+def _shadow_tile(radius, blur, alpha):
+    """Blur a small rounded rect once; its flat middle row and column stretch to any size
+
+    Returns the tile and its slice size: blur reach plus the rect's own corner,
+    everything a 9-slice stretch must keep unscaled.
+    """
+    inset = radius + blur
+    core = 2 * inset + 1
+    size = core + 2 * blur
+
+    source = QImage(core, core, QImage.Format_ARGB32_Premultiplied)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(QColor(0, 0, 0, alpha))
+    painter.drawRoundedRect(QRectF(0, 0, core, core), radius, radius)
+    painter.end()
+
+    # Half the radius matches the falloff of QGraphicsDropShadowEffect at the same setting
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur / 2)
+    item = QGraphicsPixmapItem(QPixmap.fromImage(source))
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    tile = QImage(size, size, QImage.Format_ARGB32_Premultiplied)
+    tile.fill(Qt.transparent)
+    painter = QPainter(tile)
+    scene.render(painter, QRectF(0, 0, size, size), QRectF(-blur, -blur, size, size))
+    painter.end()
+    return QPixmap.fromImage(tile), blur + inset
+
+
+def paint_card_shadow(painter, rect, radius, blur, offset, alpha):
+    """Paint a drop shadow for a rounded card background occupying rect
+
+    Looks like QGraphicsDropShadowEffect(blur, offset, black at alpha), but costs a
+    few pixmap blits instead of an offscreen render and blur on every repaint.
+    """
+    tile, slice_size = _shadow_tile(radius, blur, alpha)
+    target = QRect(rect).translated(*offset).adjusted(-blur, -blur, blur, blur)
+    if target.width() < 2 * slice_size or target.height() < 2 * slice_size:
+        painter.drawPixmap(target, tile)
+        return
+
+    xs = (0, slice_size, tile.width() - slice_size, tile.width())
+    ys = (0, slice_size, tile.height() - slice_size, tile.height())
+    txs = (target.left(), target.left() + slice_size,
+           target.right() + 1 - slice_size, target.right() + 1)
+    tys = (target.top(), target.top() + slice_size,
+           target.bottom() + 1 - slice_size, target.bottom() + 1)
+    for row in range(3):
+        for col in range(3):
+            painter.drawPixmap(
+                QRect(txs[col], tys[row], txs[col + 1] - txs[col], tys[row + 1] - tys[row]),
+                tile,
+                QRect(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row]))
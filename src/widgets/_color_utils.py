@@ -0,0 +1,45 @@
+"""
+Hex color helpers shared by the menu card widgets - results are cached per (color, factor)
+"""
+
+from functools import lru_cache
+
+
+def _channels(hex_color: str):
+    """Split a #rrggbb color into its red, green and blue bytes"""
+    value = int(hex_color[1:], 16)
+    return (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
+
+
+@lru_cache(maxsize=128)
+def lighten(hex_color: str, factor: float = 0.1) -> str:
+    """Lighten a hex color by a factor"""
+    if not hex_color.startswith('#'):
+        return hex_color
+    
+    # Parse once as a 24-bit int and split the channels
+    r, g, b = _channels(hex_color)
+    
+    # Lighten each component
+    r = min(255, int(r + (255 - r) * factor))
+    g = min(255, int(g + (255 - g) * factor))
+    b = min(255, int(b + (255 - b) * factor))
+    
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+@lru_cache(maxsize=128)
+def darken(hex_color: str, factor: float = 0.1) -> str:
+    """Darken a hex color by a factor"""
+    if not hex_color.startswith('#'):
+        return hex_color
+    
+    # Parse once as a 24-bit int and split the channels
+    r, g, b = _channels(hex_color)
+    
+    # Darken each component
+    r = max(0, int(r * (1 - factor)))
+    g = max(0, int(g * (1 - factor)))
+    b = max(0, int(b * (1 - factor)))
+    
+    return f"#{(r << 16) | (g << 8) | b:06x}"
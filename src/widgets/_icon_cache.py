@@ -0,0 +1,116 @@
+"""
+Shared icon cache - SVG icons are parsed once and their pixmaps reused by every widget
+"""
+
+from functools import lru_cache
+
+from PySide6.QtCore import Qt, QObject, QRectF, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap, QPixmapCache
+from PySide6.QtSvg import QSvgRenderer
+
+
+@lru_cache(maxsize=32)
+def cached_icon(path):
+    """Load an icon once and share it between widgets"""
+    return QIcon(path)
+
+
+def _cache_key(path, width, height):
+    return f"icon:{path}:{width}x{height}"
+
+
+def cached_pixmap(path, width, height):
+    """Render an image to fit width x height, shared through QPixmapCache
+
+    Every size is rendered from the one cached QIcon for the path, so an SVG
+    is parsed once however many sizes the widgets ask for.
+    """
+    if not path:
+        return None
+    key = _cache_key(path, width, height)
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = cached_icon(path).pixmap(width, height)
+        if pixmap.isNull():
+            return None
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _render_svg(path, width, height, dpr):
+    """Rasterize an SVG the way QIcon.pixmap does; safe off the GUI thread"""
+    renderer = QSvgRenderer(path)
+    if not renderer.isValid():
+        return None
+    size = renderer.defaultSize()
+    size.scale(round(width * dpr), round(height * dpr), Qt.KeepAspectRatio)
+    image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    painter = QPainter(image)
+    renderer.render(painter, QRectF(0, 0, size.width(), size.height()))
+    painter.end()
+    image.setDevicePixelRatio(dpr)
+    return image
+
+
+class _SvgRasterizer(QObject):
+    """Renders SVGs on the thread pool and files the results in QPixmapCache"""
+
+    rendered = Signal(str, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self._pending = set()
+        # Emitted from pool threads, so delivered queued on the GUI thread
+        self.rendered.connect(self._store)
+
+    def submit(self, path, width, height):
+        key = _cache_key(path, width, height)
+        if key in self._pending or QPixmapCache.find(key) is not None:
+            return
+        self._pending.add(key)
+        QThreadPool.globalInstance().start(
+            _SvgRenderTask(self, key, path, width, height, QGuiApplication.instance().devicePixelRatio()))
+
+    @Slot(str, QImage)
+    def _store(self, key, image):
+        self._pending.discard(key)
+        # A widget that could not wait already rendered it synchronously
+        if not image.isNull() and QPixmapCache.find(key) is None:
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
+
+
+class _SvgRenderTask(QRunnable):
+    """One off-thread SVG rasterization"""
+
+    def __init__(self, rasterizer, key, path, width, height, dpr):
+        super().__init__()
+        self._rasterizer = rasterizer
+        self._args = (key, path, width, height, dpr)
+
+    def run(self):
+        key, path, width, height, dpr = self._args
+        image = _render_svg(path, width, height, dpr)
+        try:
+            self._rasterizer.rendered.emit(key, image if image is not None else QImage())
+        except RuntimeError:
+            pass  # The application quit while this was rendering
+
+
+@lru_cache(maxsize=1)
+def _rasterizer():
+    return _SvgRasterizer()
+
+
+def prewarm_icons(entries):
+    """Render (path, width, height) entries into the cache ahead of their first paint
+
+    SVGs are rasterized on the thread pool; anything else renders here.
+    """
+    for path, width, height in entries:
+        if not path:
+            continue
+        if path.lower().endswith(".svg"):
+            _rasterizer().submit(path, width, height)
+        else:
+            cached_pixmap(path, width, height)
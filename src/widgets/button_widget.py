@@ -6,7 +6,9 @@ from PySide6.QtWidgets import QPushButton
 from PySide6.QtGui import QIcon
 from PySide6.QtCore import QSize
 
-from ..ui.theme import PRIMARY_COLOR, DANGER_COLOR
+from ..ui.theme import mono_qss
+from ..ui._qss import (BTN_PRIMARY_QSS, BTN_DANGER_QSS, BTN_ICON_TEXT_QSS,
+                       BTN_SECONDARY_QSS, BTN_COMPACT_QSS)
 
 
 class PrimaryButtonWidget(QPushButton):
@@ -15,20 +17,8 @@ class PrimaryButtonWidget(QPushButton):
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(40)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {PRIMARY_COLOR};
-                color: #FFFFFF;
-                border: 1px solid #2D333B;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }}
-            QPushButton:hover {{ background-color: #2A7FFF; }}
-            QPushButton:pressed {{ background-color: #1964D0; }}
-        """)
+        self.setObjectName("primary")
+        self.setStyleSheet(mono_qss(BTN_PRIMARY_QSS))
 
 
 class DangerButtonWidget(QPushButton):
@@ -37,20 +27,8 @@ class DangerButtonWidget(QPushButton):
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(40)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {DANGER_COLOR};
-                color: #FFFFFF;
-                border: 1px solid #7A1C23;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }}
-            QPushButton:hover {{ background-color: #b02a37; }}
-            QPushButton:pressed {{ background-color: #9a2430; }}
-        """)
+        self.setObjectName("danger")
+        self.setStyleSheet(mono_qss(BTN_DANGER_QSS))
 
 
 class IconTextButtonWidget(QPushButton):
@@ -62,20 +40,8 @@ class IconTextButtonWidget(QPushButton):
         if icon_path:
             self.setIcon(QIcon(icon_path))
             self.setIconSize(QSize(24, 24))
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #1E1E1E;
-                color: #E0E0E0;
-                border: 1px solid #2D2D2D;
-                padding: 10px 16px;
-                border-radius: 8px;
-                font-size: 14px;
-                text-align: left;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover { background-color: #2A2A2A; }
-            QPushButton:pressed { background-color: #252525; }
-        """)
+        self.setObjectName("icontext")
+        self.setStyleSheet(mono_qss(BTN_ICON_TEXT_QSS))
 
 
 class SecondaryButtonWidget(QPushButton):
@@ -84,25 +50,8 @@ class SecondaryButtonWidget(QPushButton):
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(40)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #E0E0E0;
-                border: 1px solid #444444;
-                padding: 10px 20px;
-                border-radius: 6px;
-                font-size: 14px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover { 
-                background-color: rgba(255, 255, 255, 0.1);
-                border-color: #666666;
-            }
-            QPushButton:pressed { 
-                background-color: rgba(255, 255, 255, 0.2);
-            }
-        """)
+        self.setObjectName("secondary")
+        self.setStyleSheet(mono_qss(BTN_SECONDARY_QSS))
 
 
 class CompactButtonWidget(QPushButton):
@@ -111,17 +60,5 @@ class CompactButtonWidget(QPushButton):
     def __init__(self, text: str, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(32)
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {PRIMARY_COLOR};
-                color: #FFFFFF;
-                border: none;
-                padding: 6px 12px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }}
-            QPushButton:hover {{ background-color: #2A7FFF; }}
-            QPushButton:pressed {{ background-color: #1964D0; }}
-        """)
+        self.setObjectName("compact")
+        self.setStyleSheet(mono_qss(BTN_COMPACT_QSS))
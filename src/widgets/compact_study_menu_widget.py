@@ -2,11 +2,23 @@
 Compact Study Mode Menu Widget - smaller menu for deck gallery page
 """
 
-from PySide6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QLabel, 
-                               QPushButton, QFrame, QGraphicsDropShadowEffect)
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect
-from PySide6.QtGui import QFont, QColor
+from functools import partial
+
+from PySide6.QtWidgets import QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtGui import QIcon
 from src.core.paths import asset_path
+from src.ui.theme import mono_qss
+from src.ui._qss import STUDY_MENU_QSS
+
+
+# Study modes as (type, title, icon)
+_STUDY_MODES = (
+    ("flip", "⚔️ Battle Cards", None),
+    ("multiple_choice", "🎯 Arena Choice", None),
+    ("spelling", "🖋️ Rune Spelling", None),
+    ("shuffle", "🌪️ Chaos Mode", None),
+)
 
 
 class CompactStudyModeButton(QPushButton):
@@ -18,15 +30,9 @@ class CompactStudyModeButton(QPushButton):
         self.title = title
         self.icon = icon
         self.is_active = False
-        # Accent color matching the tomato theme
-        self.accent = QColor(255, 99, 71)
         self._init_ui()
-        # Outer shadow removed (keep only inner lighting via gradients)
-        self._shadow = None
-        # Low jump animation on hold
-        self._jump_animation = QPropertyAnimation(self, b"geometry")
-        self._jump_animation.setDuration(120)
-        self._jump_animation.setEasingCurve(QEasingCurve.OutCubic)
+        # Resting position while pressed (2px "jump" is a plain move, no animation)
+        self._orig_pos = None
         
     def _init_ui(self):
         self.setText(self.title)
@@ -37,80 +43,19 @@ class CompactStudyModeButton(QPushButton):
         if self.icon and self.icon != "🔄":  # Skip if just emoji
             icon_path = asset_path("data", "images", "svg", f"{self.icon}-svgrepo-com.svg")
             if icon_path:
-                from PySide6.QtGui import QIcon
                 self.setIcon(QIcon(icon_path))
-                self.setIconSize(self.size() * 0.4)  # Scale icon to 40% of button size
-        
-        self._apply_neumorphic_style()
-
-    def _apply_neumorphic_style(self):
-        """Apply simple flat style (no inner shadow/lighting)."""
-        self.setStyleSheet("""
-            QPushButton {
-                background: rgba(40, 40, 50, 0.9);
-                color: #ff6b6b;
-                border: 2px solid rgba(255, 107, 107, 0.4);
-                border-radius: 12px;
-                padding: 10px 18px;
-                font-size: 13px;
-                font-weight: 800;
-                letter-spacing: 0.4px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background: rgba(60, 60, 70, 0.95);
-                border: 2px solid rgba(255, 107, 107, 0.8);
-                color: #ffffff;
-            }
-            QPushButton:pressed {
-                background: rgba(20, 20, 30, 0.95);
-                border: 2px solid rgba(255, 150, 150, 0.9);
-                color: #ffdddd;
-            }
-            QPushButton:disabled {
-                background: rgba(50, 50, 50, 0.5);
-                color: rgba(255, 255, 255, 0.3);
-                border: 2px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+                self.setIconSize(QSize(16, 16))  # 40% of the fixed 40px button height
 
     def set_active(self, active: bool):
         """Apply active visual style to mimic selected deck glow (tomato fill)."""
+        if active == self.is_active:
+            return
         self.is_active = active
-        if active:
-            self.setStyleSheet(
-                f"""
-                QPushButton {{
-                    background: rgba({self.accent.red()}, {self.accent.green()}, {self.accent.blue()}, 0.9);
-                    color: #ffffff;
-                    border: 2px solid rgba(255, 150, 150, 0.8);
-                    border-radius: 12px;
-                    padding: 10px 18px;
-                    font-size: 13px;
-                    font-weight: 900;
-                    letter-spacing: 0.5px;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                }}
-                QPushButton:hover {{
-                    background: rgba({self.accent.red()}, {self.accent.green()}, {self.accent.blue()}, 1.0);
-                    border: 2px solid rgba(255, 200, 200, 1.0);
-                }}
-                """
-            )
-            # No outer shadow
-        else:
-            self._apply_neumorphic_style()
-            # No outer shadow
-
-    def enterEvent(self, event):
-        """Glow on hover to echo deck card hover effect."""
-        # No outer shadow on hover
-        super().enterEvent(event)
-
-    def leaveEvent(self, event):
-        # No outer shadow on leave
-        super().leaveEvent(event)
+        # Restyle from the menu's [active="true"] rules instead of a per-instance sheet
+        self.setProperty("active", "true" if active else "false")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
 
     def mousePressEvent(self, event):
         """Low jump animation on press"""
@@ -125,22 +70,16 @@ class CompactStudyModeButton(QPushButton):
         super().mouseReleaseEvent(event)
 
     def _jump_down(self):
-        """Animate button down slightly when pressed"""
-        current_rect = self.geometry()
-        jump_rect = QRect(current_rect.x(), current_rect.y() + 2, current_rect.width(), current_rect.height())
-        self._jump_animation.stop()
-        self._jump_animation.setStartValue(current_rect)
-        self._jump_animation.setEndValue(jump_rect)
-        self._jump_animation.start()
+        """Nudge button down slightly when pressed"""
+        pos = self.pos()
+        self._orig_pos = pos
+        self.move(pos.x(), pos.y() + 2)
 
     def _jump_up(self):
         """Return button to normal position"""
-        current_rect = self.geometry()
-        normal_rect = QRect(current_rect.x(), current_rect.y() - 2, current_rect.width(), current_rect.height())
-        self._jump_animation.stop()
-        self._jump_animation.setStartValue(current_rect)
-        self._jump_animation.setEndValue(normal_rect)
-        self._jump_animation.start()
+        if self._orig_pos is not None:
+            self.move(self._orig_pos)
+            self._orig_pos = None
 
 
 class CompactStudyMenuWidget(QWidget):
@@ -155,21 +94,13 @@ class CompactStudyMenuWidget(QWidget):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.selected_decks = []
+        self.selected_decks = set()
         self.selected_mode = None
         self._init_ui()
         self.hide()  # Initially hidden
         
     def _init_ui(self):
-        self.setStyleSheet("""
-            CompactStudyMenuWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(20, 20, 26, 0.98),
-                    stop:1 rgba(10, 10, 16, 0.98));
-                border: 2px solid rgba(255, 107, 107, 0.6);
-                border-radius: 16px;
-            }
-        """)
+        self.setStyleSheet(mono_qss(STUDY_MENU_QSS))
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 10, 15, 10)
@@ -179,27 +110,12 @@ class CompactStudyMenuWidget(QWidget):
         header_layout = QHBoxLayout()
         
         self.title_label = QLabel("⚔️ Choose Your Battle Mode")
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #ff6b6b;
-                font-size: 16px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                background: transparent;
-            }
-        """)
+        self.title_label.setObjectName("menuTitle")
         header_layout.addWidget(self.title_label)
         
         # Deck count info
         self.deck_info_label = QLabel("")
-        self.deck_info_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 11px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                background: transparent;
-            }
-        """)
+        self.deck_info_label.setObjectName("deckInfo")
         header_layout.addWidget(self.deck_info_label)
         header_layout.addStretch()
         
@@ -209,22 +125,11 @@ class CompactStudyMenuWidget(QWidget):
         buttons_layout = QHBoxLayout()
         buttons_layout.setSpacing(10)
         
-        study_modes = [
-            {"type": "flip", "title": "⚔️ Battle Cards", "icon": None},
-            {"type": "multiple_choice", "title": "🎯 Arena Choice", "icon": None},
-            {"type": "spelling", "title": "🖋️ Rune Spelling", "icon": None},
-            {"type": "shuffle", "title": "🌪️ Chaos Mode", "icon": None}
-        ]
-        
         self.mode_buttons = {}
-        for mode in study_modes:
-            button = CompactStudyModeButton(
-                mode["type"], 
-                mode["title"], 
-                mode["icon"]
-            )
-            button.clicked.connect(lambda checked, m=mode["type"]: self._on_mode_clicked(m))
-            self.mode_buttons[mode["type"]] = button
+        for mode_type, title, icon in _STUDY_MODES:
+            button = CompactStudyModeButton(mode_type, title, icon)
+            button.clicked.connect(partial(self._on_mode_clicked, mode_type))
+            self.mode_buttons[mode_type] = button
             buttons_layout.addWidget(button)
         
         layout.addLayout(buttons_layout)
@@ -235,60 +140,16 @@ class CompactStudyMenuWidget(QWidget):
         actions_layout.addStretch()
 
         self.cancel_btn = QPushButton("✖ Cancel")
+        self.cancel_btn.setObjectName("cancel")
         self.cancel_btn.setFixedHeight(36)
-        self.cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(210, 60, 76, 0.95),
-                    stop:1 rgba(180, 30, 40, 0.95));
-                color: #ffffff;
-                border: 2px solid rgba(255, 120, 140, 0.85);
-                border-radius: 10px;
-                padding: 6px 14px;
-                font-size: 12px;
-                font-weight: 700;
-                letter-spacing: 0.3px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover {
-                border-color: rgba(255, 160, 170, 0.95);
-            }
-            QPushButton:pressed {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(170, 30, 40, 0.95),
-                    stop:1 rgba(140, 20, 28, 0.95));
-            }
-        """)
         self.cancel_btn.clicked.connect(self._emit_cancel)
         actions_layout.addWidget(self.cancel_btn)
 
         self.start_btn = QPushButton("▶ Start")
+        self.start_btn.setObjectName("start")
         self.start_btn.setFixedHeight(40)
         self.start_btn.setMinimumWidth(110)
         self.start_btn.setEnabled(False)
-        self.start_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 rgba(255, 230, 100, 0.98),
-                    stop:1 rgba(255, 205, 60, 0.98));
-                color: #2b2b2b;
-                border: 2px solid rgba(255, 240, 160, 0.95);
-                border-radius: 12px;
-                padding: 6px 16px;
-                font-size: 14px;
-                font-weight: 800;
-                letter-spacing: 0.5px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover { 
-                border-color: rgba(255, 250, 180, 1.0);
-            }
-            QPushButton:disabled {
-                background: rgba(120, 120, 120, 0.35);
-                color: rgba(255,255,255,0.4);
-                border: 2px solid rgba(255,255,255,0.2);
-            }
-        """)
         self.start_btn.clicked.connect(self._emit_start)
         actions_layout.addWidget(self.start_btn)
 
@@ -299,7 +160,7 @@ class CompactStudyMenuWidget(QWidget):
         
     def set_selected_decks(self, deck_ids: list, deck_names: list = None):
         """Update the selected decks and show/hide menu accordingly"""
-        self.selected_decks = deck_ids
+        self.selected_decks = set(deck_ids)
         
         if len(deck_ids) == 0:
             self.hide()
@@ -318,43 +179,48 @@ class CompactStudyMenuWidget(QWidget):
             self.deck_info_label.setText(info_text)
             
             # Enable/disable buttons based on selection
-            self._update_button_states()
-            self._update_action_states()
+            self._update_states()
     
-    def _update_button_states(self):
-        """Enable/disable buttons based on deck selection"""
-        has_selection = len(self.selected_decks) > 0
+    def _update_states(self):
+        """Enable mode buttons when decks are selected, and Start once a mode is picked too"""
+        has_selection = bool(self.selected_decks)
+        has_mode = self.selected_mode is not None
         
+        # setEnabled repolishes and repaints even when the state is unchanged
         for button in self.mode_buttons.values():
-            button.setEnabled(has_selection)
-
-    def _update_action_states(self):
-        """Enable Start/Customize when both a mode and at least one deck are selected"""
-        has_selection = len(self.selected_decks) > 0
-        has_mode = self.selected_mode is not None
+            if button.isEnabled() != has_selection:
+                button.setEnabled(has_selection)
+        
         enable = has_selection and has_mode
-        self.start_btn.setEnabled(enable)
-        self.cancel_btn.setEnabled(has_selection)
+        if self.start_btn.isEnabled() != enable:
+            self.start_btn.setEnabled(enable)
+        if self.cancel_btn.isEnabled() != has_selection:
+            self.cancel_btn.setEnabled(has_selection)
 
-    def _on_mode_clicked(self, mode_type: str):
+    def _on_mode_clicked(self, mode_type: str, checked: bool = False):
         """Toggle the selected mode with visual feedback and emit selection"""
         if self.selected_mode == mode_type:
             # Deselect if clicking again
             self.selected_mode = None
         else:
             self.selected_mode = mode_type
-        # Update visuals
-        for m, btn in self.mode_buttons.items():
-            btn.set_active(m == self.selected_mode)
+        # Update visuals; suspend painting so the button strip repaints once
+        # (re-enabling updates schedules that repaint)
+        self.setUpdatesEnabled(False)
+        try:
+            for m, btn in self.mode_buttons.items():
+                btn.set_active(m == self.selected_mode)
+        finally:
+            self.setUpdatesEnabled(True)
         # Keep external listeners informed about mode changes
         if self.selected_mode:
             self.mode_selected.emit(self.selected_mode)
-        self._update_action_states()
+        self._update_states()
 
     def _emit_start(self):
         """Emit start with current mode and selected decks"""
         if self.selected_mode and self.selected_decks:
-            self.start_requested.emit(self.selected_mode, self.selected_decks.copy())
+            self.start_requested.emit(self.selected_mode, list(self.selected_decks))
     
     def _emit_cancel(self):
         """Emit cancel to allow parent to clear selection and hide"""
@@ -364,4 +230,4 @@ class CompactStudyMenuWidget(QWidget):
     
     def get_selected_decks(self):
         """Return list of selected deck IDs"""
-        return self.selected_decks.copy()
+        return list(self.selected_decks)
@@ -2,31 +2,191 @@
 Deck Card Widgets - Individual card components for different gallery modes
 """
 
-from PySide6.QtWidgets import (QFrame, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QWidget)
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QPoint, QTimer
-from PySide6.QtGui import QIcon, QPixmap
+import time
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
+
+from PySide6.QtWidgets import QFrame, QVBoxLayout, QLabel
+from PySide6.QtCore import Qt, Signal, Slot, QObject, QTimer, QElapsedTimer, QRect, QPoint
+from PySide6.QtGui import QPainter, QPen, QColor, QFontMetrics
 from src.core.paths import asset_path
+from src.widgets._icon_cache import cached_pixmap, prewarm_icons
+from src.ui.theme import resolve_mono_font
+
+
+# Card artwork, resolved once at import
+_SWORD_SVG = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
+_TOMATO_SVG = asset_path("data", "images", "svg", "tomato-svgrepo-com.svg")
+
+# Every (path, width, height) the cards paint, see prewarm_card_artwork
+_CARD_ARTWORK = ((_SWORD_SVG, 64, 64), (_SWORD_SVG, 20, 20), (_TOMATO_SVG, 16, 16))
+
+# Painted text and button colors
+_CREATE_PLUS_COLOR = QColor(100, 200, 100, 204)
+_CREATE_TEXT_COLOR = QColor(100, 200, 100, 229)
+_NAME_COLOR = QColor(255, 255, 255)
+_COUNT_COLOR = QColor(255, 255, 255, 178)
+_DUE_COLOR = QColor("#ff6b6b")
+_PREVIEW_COLOR = QColor("#ff6347")
+_PREVIEW_HOVER_BG = QColor(255, 99, 71, 51)
+_PREVIEW_HOVER_BORDER = QColor(255, 99, 71, 153)
+
+
+def prewarm_card_artwork():
+    """Rasterize the card artwork now so the first gallery paint finds it cached"""
+    prewarm_icons(_CARD_ARTWORK)
+
+
+@lru_cache(maxsize=None)
+def _card_font(pixel_size, bold=False):
+    """Monospace card font at the given pixel size, shared between cards"""
+    font = resolve_mono_font()
+    font.setPixelSize(pixel_size)
+    font.setBold(bold)
+    return font
+
+
+@lru_cache(maxsize=2048)
+def _count_text(count):
+    """Card count caption such as '12 cards'"""
+    return f"{count} cards"
+
+
+@lru_cache(maxsize=2048)
+def _due_text(count):
+    """Due count caption such as '3 due'"""
+    return f"{count} due"
+
+
+class _CardVBox(QVBoxLayout):
+    """Vertical card layout with uniform margins and spacing"""
+    
+    def __init__(self, parent=None, margin=16, spacing=8):
+        super().__init__(parent)
+        self.setContentsMargins(margin, margin, margin, margin)
+        self.setSpacing(spacing)
+
+
+class _HoverAnimator(QObject):
+    """Drives the hover jump of every deck card from one 60 FPS timer"""
+    
+    RISE_MS = 150
+    FALL_MS = 100
+    HEIGHT = 8
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """Return the shared animator, creating it on first use"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        super().__init__()
+        # card -> [start time (ms), applied offset (px)]; weak so deleted cards
+        # drop out on their own
+        self._cards = weakref.WeakKeyDictionary()
+        self._clock = QElapsedTimer()
+        self._clock.start()
+        self._timer = QTimer(self)
+        self._timer.setInterval(16)
+        self._timer.timeout.connect(self._tick)
+        
+    def start(self, card):
+        """Start the jump for a card unless it is already in the air"""
+        if card in self._cards:
+            return
+        self._cards[card] = [self._clock.elapsed(), 0]
+        if not self._timer.isActive():
+            self._timer.start()
+            
+    def stop(self, card):
+        """Stop a card's jump without moving it"""
+        self._cards.pop(card, None)
+        
+    def is_running(self, card):
+        """Whether a card is currently jumping"""
+        return card in self._cards
+        
+    @Slot()
+    def _tick(self):
+        """Advance every jumping card in a single pass"""
+        now = self._clock.elapsed()
+        for card, state in list(self._cards.items()):
+            elapsed = now - state[0]
+            if elapsed < self.RISE_MS:
+                # Out-cubic rise
+                t = 1 - elapsed / self.RISE_MS
+                offset = self.HEIGHT * (1 - t * t * t)
+            elif elapsed < self.RISE_MS + self.FALL_MS:
+                # In-cubic fall back to the resting position
+                t = (elapsed - self.RISE_MS) / self.FALL_MS
+                offset = self.HEIGHT * (1 - t * t * t)
+            else:
+                offset = 0
+                del self._cards[card]
+            # Cards are placed by hand, not by a QLayout, so a move only repaints
+            # the old and new card rects; skip frames where the pixel offset holds
+            offset = round(offset)
+            if offset != state[1]:
+                state[1] = offset
+                home = card._original_pos
+                try:
+                    QFrame.move(card, home.x(), home.y() - offset)
+                except RuntimeError:
+                    # Qt deleted the card while Python still holds its wrapper
+                    self._cards.pop(card, None)
+        if not self._cards:
+            self._timer.stop()
 
 
 class BaseDeckCardWidget(QFrame):
-    """Base class for all deck card widgets"""
+    """Base class for all deck card widgets
+
+    Every card reports clicks through the one card_action signal as
+    (deck id, action); the create card sends deck id -1. It fires from mouse
+    press handlers; connect slots that switch pages, open dialogs or hit the
+    database with Qt.QueuedConnection so the press is painted before that
+    work starts.
+    """
+    
+    card_action = Signal(int, str)
+    
+    HOVER_THROTTLE_MS = 30
+    CLICK_ACTION = None  # Action a left click on the card sends
+    deck_id = -1
+    
+    # Painted buttons as (action, rect); a click on one sends that action
+    _BUTTONS = ()
+    
+    # Shared by all card types: restyles requested inside batch_updates()
+    _batch_depth = 0
+    _pending_restyle = set()
     
     def __init__(self, deck_data=None, parent=None):
         super().__init__(parent)
         if deck_data:
-            self.deck_id = deck_data['id']
-            self.deck_name = deck_data['name']
-            self.card_count = deck_data.get('card_count', 0)
-            self.description = deck_data.get('description', '')
-            self.due_count = deck_data.get('due_count', 0)
+            self._bind_deck(deck_data)
         
         self.setFixedSize(200, 120)
         self.setCursor(Qt.PointingHandCursor)
         
+        # Painted buttons: hit-tested here instead of child QPushButtons
+        self._buttons = self._BUTTONS
+        self._hover_button = None
+        if self._BUTTONS:
+            self.setMouseTracking(True)
+        
         # Animation support
         self._original_pos = None
-        self._jump_animation = None
-        self._is_hovered = False
+        
+        # Hover throttling: rapid enter/leave crossings collapse into one update
+        self._hover_applied = False
+        self._hover_applied_at = 0.0
+        self._hover_pending = False
         
         self.init_ui()
         
@@ -34,51 +194,121 @@ class BaseDeckCardWidget(QFrame):
         """Override in subclasses"""
         pass
         
-    def _create_jump_animation(self):
-        """Create the jump animation for hover effect"""
-        self._jump_animation = QPropertyAnimation(self, b"pos")
-        self._jump_animation.setDuration(150)
-        self._jump_animation.setEasingCurve(QEasingCurve.OutCubic)
-        self._jump_animation.finished.connect(self._on_jump_finished)
+    def _bind_deck(self, deck_data):
+        """Copy the fields of deck_data onto the card"""
+        self.deck_id = deck_data['id']
+        self.deck_name = deck_data['name']
+        self.card_count = deck_data.get('card_count', 0)
+        self.description = deck_data.get('description', '')
+        self.due_count = deck_data.get('due_count', 0)
+        
+    def set_deck(self, deck_data):
+        """Show another deck on this card, reusing the widget"""
+        self._bind_deck(deck_data)
+        self._refresh_deck()
+        
+    def _refresh_deck(self):
+        """Override in subclasses to redisplay the deck fields"""
+        pass
         
-    def _start_jump_animation(self):
-        """Start the jump animation"""
-        if self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running:
-            return
-        if self._original_pos is None:
-            self._original_pos = self.pos()
+    @staticmethod
+    @contextmanager
+    def batch_updates():
+        """Defer card restyles until the outermost batch exits"""
+        BaseDeckCardWidget._batch_depth += 1
+        try:
+            yield
+        finally:
+            BaseDeckCardWidget._batch_depth -= 1
+            if BaseDeckCardWidget._batch_depth == 0:
+                pending = list(BaseDeckCardWidget._pending_restyle)
+                BaseDeckCardWidget._pending_restyle.clear()
+                for card in pending:
+                    card._update_style()
+                    
+    def _defer_restyle(self):
+        """Queue this card's restyle if a batch is open; return whether it was queued"""
+        if BaseDeckCardWidget._batch_depth == 0:
+            return False
+        BaseDeckCardWidget._pending_restyle.add(self)
+        return True
+        
+    def _update_style(self):
+        """Override in subclasses that restyle with their state"""
+        pass
         
-        jump_pos = QPoint(self._original_pos.x(), self._original_pos.y() - 8)
-        self._jump_animation.setStartValue(self._original_pos)
-        self._jump_animation.setEndValue(jump_pos)
-        self._jump_animation.start()
-        
-    def _on_jump_finished(self):
-        """Handle jump animation finished - return to original position"""
-        if self._jump_animation:
-            return_animation = QPropertyAnimation(self, b"pos")
-            return_animation.setDuration(100)
-            return_animation.setEasingCurve(QEasingCurve.InCubic)
-            return_animation.setStartValue(self.pos())
-            return_animation.setEndValue(self._original_pos)
-            return_animation.start()
-            
     def enterEvent(self, event):
         """Handle mouse enter event"""
-        if not self._is_hovered:
-            self._is_hovered = True
-            self._on_hover_enter()
+        self._schedule_hover()
         super().enterEvent(event)
         
     def leaveEvent(self, event):
         """Handle mouse leave event"""
-        if self._is_hovered:
-            self._is_hovered = False
+        if self._hover_button is not None:
+            self._hover_button = None
+            self.update()
+        self._schedule_hover()
+        super().leaveEvent(event)
+        
+    def _schedule_hover(self):
+        """Apply the hover state now, or once the HOVER_THROTTLE_MS window ends"""
+        if self._hover_pending:
+            return  # The scheduled apply will read the latest underMouse()
+        wait = self._hover_applied_at + self.HOVER_THROTTLE_MS / 1000 - time.monotonic()
+        if wait <= 0:
+            self._apply_hover()
+        else:
+            self._hover_pending = True
+            QTimer.singleShot(int(wait * 1000) + 1, self, self._apply_hover)
+            
+    @Slot()
+    def _apply_hover(self):
+        """Run the hover enter/leave handlers if the hover state changed"""
+        self._hover_pending = False
+        # Qt keeps underMouse() current before delivering Enter/Leave
+        hovered = self.underMouse()
+        if hovered == self._hover_applied:
+            return
+        self._hover_applied = hovered
+        self._hover_applied_at = time.monotonic()
+        if hovered:
+            self._on_hover_enter()
+        else:
             self._on_hover_leave()
-            if self._original_pos is not None:
+            # A jump in flight lands on its own; otherwise make sure we're home
+            if self._original_pos is not None and not _HoverAnimator.instance().is_running(self):
                 self.move(self._original_pos)
-        super().leaveEvent(event)
         
+    def mousePressEvent(self, event):
+        """Handle left clicks for every card type"""
+        if event.button() == Qt.LeftButton:
+            button = self._button_at(event.position().toPoint())
+            if button is not None:
+                self.card_action.emit(self.deck_id, button)
+            else:
+                self._on_left_click()
+        super().mousePressEvent(event)
+        
+    def mouseMoveEvent(self, event):
+        """Track the hovered painted button (only cards with _BUTTONS track moves)"""
+        button = self._button_at(event.position().toPoint())
+        if button != self._hover_button:
+            self._hover_button = button
+            self.update()
+        super().mouseMoveEvent(event)
+        
+    def _button_at(self, pos):
+        """Return the action of the painted button at pos, if any"""
+        for name, rect in self._buttons:
+            if rect.contains(pos):
+                return name
+        return None
+        
+    def _on_left_click(self):
+        """Send the card's CLICK_ACTION; override for richer click behavior"""
+        if self.CLICK_ACTION:
+            self.card_action.emit(self.deck_id, self.CLICK_ACTION)
+            
     def _on_hover_enter(self):
         """Override in subclasses for hover enter behavior"""
         pass
@@ -87,16 +317,19 @@ class BaseDeckCardWidget(QFrame):
         """Override in subclasses for hover leave behavior"""
         pass
         
-    def move(self, pos):
-        """Override move to update original position"""
-        super().move(pos)
-        if not (self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running):
-            self._original_pos = pos
-            
+    def _start_jump_animation(self):
+        """Start the hover jump on the shared animator"""
+        if self._original_pos is None:
+            self._original_pos = self.pos()
+        _HoverAnimator.instance().start(self)
+        
+    def set_home_pos(self, pos):
+        """Record the resting position the owning layout placed the card at"""
+        self._original_pos = QPoint(pos)
+        
     def reset_position(self):
         """Reset the widget to its original position and stop any animations"""
-        if self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running:
-            self._jump_animation.stop()
+        _HoverAnimator.instance().stop(self)
         if self._original_pos is not None:
             self.move(self._original_pos)
         else:
@@ -106,62 +339,24 @@ class BaseDeckCardWidget(QFrame):
 class CreateDeckCardWidget(BaseDeckCardWidget):
     """Special card widget for creating new decks"""
     
-    create_deck = Signal()
+    CLICK_ACTION = "create"
+    
+    _PLUS_RECT = QRect(18, 18, 164, 44)
+    _TEXT_RECT = QRect(18, 70, 164, 32)
     
     def __init__(self, parent=None):
         super().__init__(None, parent)
         
-    def init_ui(self):
-        """Initialize the create deck card UI with hover effects"""
-        self._create_jump_animation()
-        self.setStyleSheet("""
-            CreateDeckCardWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(100, 200, 100, 0.3),
-                    stop:1 rgba(60, 160, 60, 0.3));
-                border: 2px dashed rgba(100, 200, 100, 0.6);
-                border-radius: 12px;
-            }
-            CreateDeckCardWidget:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(120, 220, 120, 0.4),
-                    stop:1 rgba(80, 180, 80, 0.4));
-                border: 2px dashed rgba(120, 220, 120, 0.8);
-            }
-        """)
-        
-        # Layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(8)
-        
-        # Plus icon
-        plus_label = QLabel("+")
-        plus_label.setAlignment(Qt.AlignCenter)
-        plus_label.setStyleSheet("""
-            QLabel {
-                color: rgba(100, 200, 100, 0.8);
-                font-size: 36px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        layout.addWidget(plus_label)
-        
-        # Create text
-        create_label = QLabel("New Deck")
-        create_label.setAlignment(Qt.AlignCenter)
-        create_label.setStyleSheet("""
-            QLabel {
-                color: rgba(100, 200, 100, 0.9);
-                font-size: 14px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        layout.addWidget(create_label)
+    def paintEvent(self, event):
+        """Paint the styled background, then the plus sign and caption"""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setPen(_CREATE_PLUS_COLOR)
+        painter.setFont(_card_font(36, bold=True))
+        painter.drawText(self._PLUS_RECT, Qt.AlignCenter, "+")
+        painter.setPen(_CREATE_TEXT_COLOR)
+        painter.setFont(_card_font(14, bold=True))
+        painter.drawText(self._TEXT_RECT, Qt.AlignCenter, "New Deck")
         
     def _on_hover_enter(self):
         """Start jump animation on hover"""
@@ -170,217 +365,129 @@ class CreateDeckCardWidget(BaseDeckCardWidget):
     def _on_hover_leave(self):
         """Handle hover leave"""
         pass  # Jump animation handles return automatically
-        
-    def mousePressEvent(self, event):
-        """Handle mouse click to create deck"""
-        if event.button() == Qt.LeftButton:
-            self.create_deck.emit()
-        super().mousePressEvent(event)
 
 
 class StudyDeckCardWidget(BaseDeckCardWidget):
     """Deck card widget for study mode with multi-selection support"""
     
-    deck_selected = Signal(int)
-    preview_requested = Signal(int)
+    CLICK_ACTION = "select"
+    
+    # Area above the preview button that the deck text may occupy
+    _TEXT_RECT = QRect(16, 16, 168, 60)
+    _PREVIEW_RECT = QRect(86, 76, 28, 28)
+    _BUTTONS = (("preview", _PREVIEW_RECT),)
     
     def __init__(self, deck_data, parent=None):
         self.is_selected = False
         self.sword_label = None
         self.centered_sword = None
-        self.text_container = None
-        self.preview_btn = None
+        self._text_items = ()
         super().__init__(deck_data, parent)
         
     def init_ui(self):
         """Initialize the study deck card UI"""
-        self._create_jump_animation()
         self._update_style()
         
-        # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(8)
-        
-        # Text content container
-        self.text_container = QWidget()
-        text_layout = QVBoxLayout(self.text_container)
-        text_layout.setContentsMargins(0, 0, 0, 0)
-        text_layout.setSpacing(4)
+        # Deck name, card count and due count are painted, as is the preview
+        # button (see paintEvent)
+        self._text_items = self._layout_text()
         
-        # Deck name
-        self.name_label = QLabel(self.deck_name)
-        self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        self.name_label.setWordWrap(True)
-        text_layout.addWidget(self.name_label)
+    def _refresh_deck(self):
+        """Drop the previous deck's selection and repaint the deck text"""
+        self.set_selected(False)
+        self._text_items = self._layout_text()
+        self.update()
         
-        # Card count info
-        self.count_label = QLabel(f"{self.card_count} cards")
-        self.count_label.setAlignment(Qt.AlignCenter)
-        self.count_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        text_layout.addWidget(self.count_label)
-        
-        # Due count (if any)
+    def _layout_text(self):
+        """Stack the deck text lines from the top of the text area"""
+        lines = [(self.deck_name, _card_font(16, bold=True), _NAME_COLOR, Qt.AlignCenter | Qt.TextWordWrap),
+                 (_count_text(self.card_count), _card_font(12), _COUNT_COLOR, Qt.AlignCenter)]
         if self.due_count > 0:
-            self.due_label = QLabel(f"{self.due_count} due")
-            self.due_label.setAlignment(Qt.AlignCenter)
-            self.due_label.setStyleSheet("""
-                QLabel {
-                    color: #ff6b6b;
-                    font-size: 11px;
-                    font-weight: bold;
-                    background: transparent;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                }
-            """)
-            text_layout.addWidget(self.due_label)
+            lines.append((_due_text(self.due_count), _card_font(11, bold=True), _DUE_COLOR, Qt.AlignCenter))
+        
+        items = []
+        area = self._TEXT_RECT
+        y = area.top()
+        for text, font, color, flags in lines:
+            height = QFontMetrics(font).boundingRect(0, 0, area.width(), 0, flags, text).height()
+            items.append((QRect(area.left(), y, area.width(), height), flags, font, color, text))
+            y += height + 4
+        return tuple(items)
+        
+    def paintEvent(self, event):
+        """Paint the styled background, then the text and preview button unless selected"""
+        super().paintEvent(event)
+        if self.is_selected:
+            return
+        painter = QPainter(self)
+        painter.setClipRect(self._TEXT_RECT)
+        for rect, flags, font, color, text in self._text_items:
+            painter.setFont(font)
+            painter.setPen(color)
+            painter.drawText(rect, flags, text)
+        painter.setClipping(False)
+        
+        rect = self._PREVIEW_RECT
+        if self._hover_button == "preview":
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(QPen(_PREVIEW_HOVER_BORDER, 2))
+            painter.setBrush(_PREVIEW_HOVER_BG)
+            painter.drawEllipse(rect.adjusted(1, 1, -1, -1))
+        icon = cached_pixmap(_TOMATO_SVG, 16, 16)
+        if icon is not None:
+            painter.drawPixmap(rect.x() + (rect.width() - icon.width()) // 2,
+                               rect.y() + (rect.height() - icon.height()) // 2, icon)
+        else:
+            painter.setPen(_PREVIEW_COLOR)
+            painter.setFont(_card_font(14, bold=True))
+            painter.drawText(rect, Qt.AlignCenter, "🍅")
             
-        layout.addWidget(self.text_container)
-        
-        # Centered sword for selection state (initially hidden)
-        self.centered_sword = QLabel()
+    def _ensure_centered_sword(self):
+        """Create the centered selection sword the first time it is needed"""
+        if self.centered_sword is not None:
+            return self.centered_sword
+        self.centered_sword = QLabel(self)
         self.centered_sword.setAlignment(Qt.AlignCenter)
         self.centered_sword.setFixedSize(200, 120)
-        self.centered_sword.setStyleSheet("QLabel { background: transparent; border: none; }")
-        
-        # Load SVG sword image for centered display
-        sword_center_path = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
-        if sword_center_path:
-            pix = QPixmap(sword_center_path)
-            if not pix.isNull():
-                scaled = pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.centered_sword.setPixmap(scaled)
-            else:
-                self.centered_sword.setText("⚔️")
+        self.centered_sword.setObjectName("sword")
+        
+        pix = cached_pixmap(_SWORD_SVG, 64, 64)
+        if pix is not None:
+            self.centered_sword.setPixmap(pix)
         else:
             self.centered_sword.setText("⚔️")
-        self.centered_sword.hide()
         
-        # Position centered sword to overlay the entire card
+        # Overlay the entire card
         self.centered_sword.move(0, 0)
-        self.centered_sword.setParent(self)
+        return self.centered_sword
         
-        layout.addStretch()
-        
-        # Preview button (tomato icon)
-        self.preview_btn = QPushButton()
-        self.preview_btn.setFixedSize(28, 28)
-        
-        # Try to use tomato SVG icon
-        tomato_path = asset_path("data", "images", "svg", "tomato-svgrepo-com.svg")
-        if tomato_path:
-            icon = QIcon(tomato_path)
-            if not icon.isNull():
-                self.preview_btn.setIcon(icon)
-                self.preview_btn.setText("")
-            else:
-                self.preview_btn.setText("🍅")
-        else:
-            self.preview_btn.setText("🍅")
-        
-        self.preview_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #ff6347;
-                border: 2px solid transparent;
-                border-radius: 14px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 99, 71, 0.2);
-                border: 2px solid rgba(255, 99, 71, 0.6);
-                color: #ff4500;
-            }
-            QPushButton:pressed {
-                background: rgba(255, 99, 71, 0.4);
-                border: 2px solid rgba(255, 99, 71, 0.8);
-            }
-        """)
-        
-        self.preview_btn.clicked.connect(lambda: self.preview_requested.emit(self.deck_id))
-        
-        # Center the preview button at bottom
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-        button_layout.addWidget(self.preview_btn)
-        button_layout.addStretch()
-        layout.addLayout(button_layout)
-        
-        # Sword overlay (initially hidden)
-        self.sword_label = QLabel()
+    def _ensure_sword_label(self):
+        """Create the top-right hover sword the first time it is needed"""
+        if self.sword_label is not None:
+            return self.sword_label
+        self.sword_label = QLabel(self)
         self.sword_label.setFixedSize(24, 24)
-        self.sword_label.hide()
-
-        # Try to use sword SVG icon
-        sword_path = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
-        if sword_path:
-            pixmap = QPixmap(sword_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.sword_label.setPixmap(scaled_pixmap)
-            else:
-                self.sword_label.setText("⚔️")
+        self.sword_label.setObjectName("sword")
+        self.sword_label.setContentsMargins(0, 0, 0, 0)
+        
+        pixmap = cached_pixmap(_SWORD_SVG, 20, 20)
+        if pixmap is not None:
+            self.sword_label.setPixmap(pixmap)
         else:
             self.sword_label.setText("⚔️")
-
-        self.sword_label.setStyleSheet("QLabel { background: transparent; border: none; }")
-        self.sword_label.setContentsMargins(0, 0, 0, 0)
-
+        
         # Position sword in top-right corner
         self.sword_label.move(170, 10)
-        self.sword_label.setParent(self)
+        return self.sword_label
         
     def _update_style(self):
         """Update styling based on selection state"""
-        if self.is_selected:
-            style = """
-                StudyDeckCardWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(20, 20, 25, 0.95),
-                        stop:1 rgba(10, 10, 15, 0.95));
-                    border-radius: 12px;
-                    border: none;
-                }
-                StudyDeckCardWidget:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(30, 30, 35, 0.95),
-                        stop:1 rgba(15, 15, 20, 0.95));
-                }
-            """
-        else:
-            style = """
-                StudyDeckCardWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(60, 60, 60, 0.9),
-                        stop:1 rgba(40, 40, 40, 0.9));
-                    border-radius: 12px;
-                    border: none;
-                }
-                StudyDeckCardWidget:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(45, 45, 50, 0.95),
-                        stop:1 rgba(25, 25, 30, 0.95));
-                }
-            """
-        self.setStyleSheet(style)
+        if self._defer_restyle():
+            return
+        self.setProperty("selected", "true" if self.is_selected else "false")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
     
     def toggle_selection(self):
         """Toggle the selection state of this deck card"""
@@ -391,6 +498,8 @@ class StudyDeckCardWidget(BaseDeckCardWidget):
     
     def set_selected(self, selected: bool):
         """Set the selection state explicitly"""
+        if self.is_selected == selected:
+            return
         self.is_selected = selected
         self._update_style()
         self._update_selection_display()
@@ -398,161 +507,90 @@ class StudyDeckCardWidget(BaseDeckCardWidget):
     def _update_selection_display(self):
         """Update the visual display based on selection state"""
         if self.is_selected:
-            # Hide text content and show centered sword
-            self.text_container.hide()
-            self.preview_btn.hide()
-            self.centered_sword.show()
+            # Hide text content and preview, show centered sword
+            self._buttons = ()
+            self._hover_button = None
+            self._ensure_centered_sword().show()
         else:
-            # Show text content and hide centered sword
-            self.text_container.show()
-            self.preview_btn.show()
-            self.centered_sword.hide()
+            # Show text content and preview, hide centered sword
+            self._buttons = self._BUTTONS
+            if self.centered_sword is not None:
+                self.centered_sword.hide()
+        self.update()  # Text and preview are painted only while unselected
     
     def _on_hover_enter(self):
         """Show sword and start jump animation on hover"""
-        if self.sword_label:
-            self.sword_label.show()
+        self._ensure_sword_label().show()
         self._start_jump_animation()
         
     def _on_hover_leave(self):
         """Hide sword on hover leave"""
-        if self.sword_label:
+        if self.sword_label is not None:
             self.sword_label.hide()
             
-    def mousePressEvent(self, event):
-        """Handle mouse click to toggle deck selection"""
-        if event.button() == Qt.LeftButton:
-            self.toggle_selection()
-            self.deck_selected.emit(self.deck_id)
-        super().mousePressEvent(event)
+    def _on_left_click(self):
+        """Toggle deck selection on click"""
+        self.toggle_selection()
+        super()._on_left_click()
 
 
 class ManagementDeckCardWidget(BaseDeckCardWidget):
     """Deck card widget for management mode with hover effects"""
     
-    deck_selected = Signal(int)  # For studying
-    edit_deck = Signal(int)      # For editing cards
-    delete_deck = Signal(int)
+    CLICK_ACTION = "edit"  # Clicking the card edits its cards
+    
+    _BUTTONS = (("edit", QRect(31, 88, 35, 20)),
+                ("study", QRect(89, 88, 35, 20)),
+                ("delete", QRect(147, 88, 20, 20)))
+    # name -> (text, color, hover color, corner radius, font pixel size)
+    _BUTTON_STYLES = {
+        "edit": ("Edit", QColor("#ffa726"), QColor("#ff9800"), 4, 9),
+        "study": ("Study", QColor("#64c8ff"), QColor("#4a9eff"), 4, 9),
+        "delete": ("×", QColor("#ff6b6b"), QColor("#ff5252"), 10, 12),
+    }
     
     def init_ui(self):
         """Initialize the management deck card UI with hover effects"""
-        self._create_jump_animation()
-        self.setStyleSheet("""
-            ManagementDeckCardWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(60, 60, 60, 0.9),
-                    stop:1 rgba(40, 40, 40, 0.9));
-                border-radius: 12px;
-                border: none;
-            }
-            ManagementDeckCardWidget:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(80, 80, 80, 0.9),
-                    stop:1 rgba(60, 60, 60, 0.9));
-            }
-        """)
         
         # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(12, 12, 12, 12)
-        layout.setSpacing(6)
+        layout = _CardVBox(self, margin=12, spacing=6)
         
         # Deck name
-        name_label = QLabel(self.deck_name)
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 14px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        name_label.setWordWrap(True)
-        layout.addWidget(name_label)
+        self.name_label = QLabel(self.deck_name)
+        self.name_label.setAlignment(Qt.AlignCenter)
+        self.name_label.setObjectName("deckName")
+        self.name_label.setWordWrap(True)
+        layout.addWidget(self.name_label)
         
         # Card count
-        count_label = QLabel(f"{self.card_count} cards")
-        count_label.setAlignment(Qt.AlignCenter)
-        count_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 11px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        layout.addWidget(count_label)
+        self.count_label = QLabel(_count_text(self.card_count))
+        self.count_label.setAlignment(Qt.AlignCenter)
+        self.count_label.setObjectName("deckCount")
+        layout.addWidget(self.count_label)
         
         layout.addStretch()
         
-        # Action buttons
-        actions_layout = QHBoxLayout()
-        actions_layout.setSpacing(4)
-        
-        # Edit button
-        edit_btn = QPushButton("Edit")
-        edit_btn.setFixedSize(35, 20)
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffa726;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 9px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover {
-                background-color: #ff9800;
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.edit_deck.emit(self.deck_id))
-        actions_layout.addWidget(edit_btn)
-        
-        # Study button
-        study_btn = QPushButton("Study")
-        study_btn.setFixedSize(35, 20)
-        study_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #64c8ff;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 9px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover {
-                background-color: #4a9eff;
-            }
-        """)
-        study_btn.clicked.connect(lambda: self.deck_selected.emit(self.deck_id))
-        actions_layout.addWidget(study_btn)
-        
-        # Delete button
-        delete_btn = QPushButton("×")
-        delete_btn.setFixedSize(20, 20)
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff6b6b;
-                color: white;
-                border: none;
-                border-radius: 10px;
-                font-size: 12px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover {
-                background-color: #ff5252;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_deck.emit(self.deck_id))
-        actions_layout.addWidget(delete_btn)
-        
-        layout.addLayout(actions_layout)
-        
+        # Edit / Study / Delete buttons are painted (see paintEvent)
+        
+    def _refresh_deck(self):
+        """Update the deck labels"""
+        self.name_label.setText(self.deck_name)
+        self.count_label.setText(_count_text(self.card_count))
+        
+    def paintEvent(self, event):
+        """Paint the styled background, then the action buttons"""
+        super().paintEvent(event)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for name, rect in self._BUTTONS:
+            text, color, hover_color, radius, size = self._BUTTON_STYLES[name]
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(hover_color if name == self._hover_button else color)
+            painter.drawRoundedRect(rect, radius, radius)
+            painter.setPen(_NAME_COLOR)
+            painter.setFont(_card_font(size, bold=True))
+            painter.drawText(rect, Qt.AlignCenter, text)
+            
     def _on_hover_enter(self):
         """Start jump animation on hover"""
         self._start_jump_animation()
@@ -560,72 +598,32 @@ class ManagementDeckCardWidget(BaseDeckCardWidget):
     def _on_hover_leave(self):
         """Handle hover leave"""
         pass  # Jump animation handles return automatically
-        
-    def mousePressEvent(self, event):
-        """Handle mouse click on deck card to edit"""
-        if event.button() == Qt.LeftButton:
-            self.edit_deck.emit(self.deck_id)
-        super().mousePressEvent(event)
 
 
 class SelectionDeckCardWidget(BaseDeckCardWidget):
     """Simple deck card widget for selection mode"""
     
-    deck_selected = Signal(int)
+    CLICK_ACTION = "select"
     
     def init_ui(self):
         """Initialize the selection deck card UI"""
-        self.setStyleSheet("""
-            SelectionDeckCardWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(60, 60, 60, 0.9),
-                    stop:1 rgba(40, 40, 40, 0.9));
-                border-radius: 12px;
-                border: 2px solid transparent;
-            }
-            SelectionDeckCardWidget:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(80, 80, 80, 0.9),
-                    stop:1 rgba(60, 60, 60, 0.9));
-                border: 2px solid rgba(100, 150, 255, 0.6);
-            }
-        """)
-        
         # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(16, 16, 16, 16)
-        layout.setSpacing(8)
+        layout = _CardVBox(self)
         
         # Deck name
-        name_label = QLabel(self.deck_name)
-        name_label.setAlignment(Qt.AlignCenter)
-        name_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        name_label.setWordWrap(True)
-        layout.addWidget(name_label)
+        self.name_label = QLabel(self.deck_name)
+        self.name_label.setAlignment(Qt.AlignCenter)
+        self.name_label.setObjectName("deckName")
+        self.name_label.setWordWrap(True)
+        layout.addWidget(self.name_label)
         
         # Card count
-        count_label = QLabel(f"{self.card_count} cards")
-        count_label.setAlignment(Qt.AlignCenter)
-        count_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
-        layout.addWidget(count_label)
+        self.count_label = QLabel(_count_text(self.card_count))
+        self.count_label.setAlignment(Qt.AlignCenter)
+        self.count_label.setObjectName("deckCount")
+        layout.addWidget(self.count_label)
         
-    def mousePressEvent(self, event):
-        """Handle mouse click to select deck"""
-        if event.button() == Qt.LeftButton:
-            self.deck_selected.emit(self.deck_id)
-        super().mousePressEvent(event)
+    def _refresh_deck(self):
+        """Update the deck labels"""
+        self.name_label.setText(self.deck_name)
+        self.count_label.setText(_count_text(self.card_count))
@@ -4,10 +4,98 @@ Modular Deck Gallery Widget - Reusable component for deck display and management
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QScrollArea, QGraphicsDropShadowEffect, QPushButton)
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QTimer, QPoint
-from PySide6.QtGui import QColor
+from PySide6.QtCore import (Qt, Signal, Slot, QPropertyAnimation, QVariantAnimation,
+                            QEasingCurve, QTimer, QPoint)
+from PySide6.QtGui import QColor, QPainter, QGuiApplication
 from src.ui.responsive_grid_layout import ResponsiveGridLayout
+from src.ui.theme import mono_qss
+from src.ui._qss import DECK_CARD_QSS
+from src.widgets.deck_card_widgets import (BaseDeckCardWidget, CreateDeckCardWidget, StudyDeckCardWidget,
+                                           ManagementDeckCardWidget, SelectionDeckCardWidget,
+                                           prewarm_card_artwork)
 from enum import Enum
+from functools import lru_cache
+import math
+
+
+# Study title glow: one pulse is sampled into this many precomputed frames
+GLOW_FRAMES = 64
+GLOW_PERIOD_MS = 3140  # One full pulse
+
+# Platforms without a real display, where the glow's drop shadow blur is
+# pure CPU cost; the gallery starts in low power mode on these
+_SOFTWARE_PLATFORMS = ("offscreen", "minimal", "vnc")
+
+# Detached deck cards kept for reuse beyond what the current deck list needs
+CARD_POOL_SPARE = 8
+
+_STUDY_TITLE_QSS = """
+    QLabel {
+        color: rgba(255, 215, 0, 0.9);
+        font-size: 24px;
+        font-weight: bold;
+        background: transparent;
+        border: none;
+        outline: none;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+        margin: 15px 0px;
+        padding: 0px;
+        letter-spacing: 2px;
+    }
+"""
+
+
+def _deck_signature(deck):
+    """The deck fields a card displays, for spotting unchanged decks"""
+    return (deck['id'], deck['name'], deck.get('card_count', 0),
+            deck.get('description', ''), deck.get('due_count', 0))
+
+
+@lru_cache(maxsize=1)
+def _title_glow_frames():
+    """Precompute (text color, shadow color, blur radius) for each glow frame"""
+    base_color = QColor(255, 215, 0)  # Gold
+    glow_color = QColor(255, 69, 0)   # Red-orange glow
+    frames = []
+    for i in range(GLOW_FRAMES):
+        phase = 2 * math.pi * i / GLOW_FRAMES
+        
+        # Calculate pulsing values
+        pulse_intensity = 0.3 + 0.2 * math.sin(phase)
+        glow_intensity = 0.7 + 0.3 * math.sin(phase * 0.7)
+        
+        # Mix colors based on pulse
+        final_color = QColor(
+            int(base_color.red() * (1 - pulse_intensity) + glow_color.red() * pulse_intensity),
+            int(base_color.green() * (1 - pulse_intensity) + glow_color.green() * pulse_intensity),
+            int(base_color.blue() * (1 - pulse_intensity) + glow_color.blue() * pulse_intensity)
+        )
+        final_color.setAlphaF(glow_intensity)
+        shadow = QColor(glow_color.red(), glow_color.green(), glow_color.blue(), int(100 * pulse_intensity))
+        frames.append((final_color, shadow, int(15 * pulse_intensity)))
+    return tuple(frames)
+
+
+class _GlowTitleLabel(QLabel):
+    """Title label whose text color can be animated without touching its stylesheet"""
+    
+    def __init__(self, text="", parent=None):
+        super().__init__(text, parent)
+        self._text_color = None
+        
+    def set_text_color(self, color):
+        """Paint the text in color, or in the stylesheet color when None"""
+        self._text_color = color
+        self.update()
+        
+    def paintEvent(self, event):
+        """Draw plain text in the animated color; the sheet keeps font and margins"""
+        if self._text_color is None:
+            super().paintEvent(event)
+            return
+        painter = QPainter(self)
+        painter.setPen(self._text_color)
+        painter.drawText(self.contentsRect(), int(self.alignment()), self.text())
 
 
 class DeckGalleryMode(Enum):
@@ -39,30 +127,64 @@ class DeckGalleryWidget(QWidget):
         self.title_text = title
         self.show_title = show_title
         self.deck_cards = []
-        self.deck_id_to_name = {}
+        self._card_pool = []  # Deck cards of the current mode, reused by refresh_decks
+        self._create_card = None
+        self._deck_sigs = None  # _deck_signature() of each deck last shown
         self._decks_cache = []
-        self.selected_deck_ids = set()
+        
+        # Per-deck records as parallel lists, index-aligned with _card_pool
+        self._deck_ids = []
+        self._deck_names = []
+        self._id_to_index = {}
+        self._selected = bytearray()  # 1 where the deck at that index is selected
+        self._last_emitted_selection = frozenset()  # Selection listeners last saw
         
         # Animation attributes
-        self._animation_timer = None
-        self._glow_phase = 0
+        self._glow_anim = None
+        self._glow_frame = 0
+        self._glow_frames = ()
         self._shadow_effect = None
+        self._low_power = QGuiApplication.platformName() in _SOFTWARE_PLATFORMS
         self._typing_timer = None
         self._typing_index = 0
         self._is_visible = False
         
+        # Card class and card action -> handler for each mode
+        self._card_ctor = {
+            DeckGalleryMode.STUDY: StudyDeckCardWidget,
+            DeckGalleryMode.MANAGEMENT: ManagementDeckCardWidget,
+            DeckGalleryMode.SELECTION: SelectionDeckCardWidget,
+        }
+        self._card_actions = {
+            DeckGalleryMode.STUDY: {
+                'select': self._handle_deck_selection,
+                'preview': self.deck_preview.emit},
+            DeckGalleryMode.MANAGEMENT: {
+                'edit': self.deck_edit.emit,
+                'study': self.deck_selected.emit,
+                'delete': self.deck_delete.emit,
+                'create': lambda deck_id: self.deck_create.emit()},
+            DeckGalleryMode.SELECTION: {
+                'select': self.deck_selected.emit},
+        }
+        
         self.init_ui()
+        # Render the card artwork once the event loop is idle, before any card paints it;
+        # the SVGs rasterize on the thread pool
+        QTimer.singleShot(0, prewarm_card_artwork)
         
     def init_ui(self):
         """Initialize the deck gallery UI based on mode"""
-        self.setStyleSheet("""
+        # The deck card rules live here, after the catch-all QWidget rule, so the
+        # cards share one parsed sheet instead of each carrying their own
+        self.setStyleSheet(mono_qss("""
             DeckGalleryWidget {
                 background: transparent;
             }
             QWidget {
                 background: transparent;
             }
-        """)
+        """ + DECK_CARD_QSS))
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -113,6 +235,12 @@ class DeckGalleryWidget(QWidget):
         # Store reference to scroll area for resize handling
         self.scroll_area = scroll_area
         
+        # Coalesce a burst of resize events (e.g. a window drag) into one grid pass
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.deck_cards_layout._recalculate_layout)
+        
     def _create_title_section(self, parent_layout):
         """Create the title section based on mode"""
         title_layout = QHBoxLayout()
@@ -121,25 +249,12 @@ class DeckGalleryWidget(QWidget):
         
         if self.mode == DeckGalleryMode.STUDY:
             # Animated typing title for study mode
-            self.title_label = QLabel("")
+            self.title_label = _GlowTitleLabel("")
             self.title_label.setAlignment(Qt.AlignCenter)
             self._typing_text = self.title_text or "⚔️ Choose Your Weapon ⚔️"
             self._typing_index = 0
             self._typing_timer = None
-            self.title_label.setStyleSheet("""
-                QLabel {
-                    color: rgba(255, 215, 0, 0.9);
-                    font-size: 24px;
-                    font-weight: bold;
-                    background: transparent;
-                    border: none;
-                    outline: none;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                    margin: 15px 0px;
-                    padding: 0px;
-                    letter-spacing: 2px;
-                }
-            """)
+            self.title_label.setStyleSheet(_STUDY_TITLE_QSS)
         else:
             # Static title for other modes
             display_title = self.title_text or "Deck Gallery"
@@ -162,36 +277,70 @@ class DeckGalleryWidget(QWidget):
         
     def refresh_decks(self, decks):
         """Refresh the deck gallery with new deck data"""
+        self._rebuild_cards(decks)
+        # The rebuild clears the selection; report that once, after the cards
+        # are in place
+        if self._take_selection_change():
+            self.selection_changed.emit([])
+            
+    def _rebuild_cards(self, decks):
+        """Show decks on the pooled cards, clearing the selection"""
         self._decks_cache = decks or []
+        self._selected = bytearray(len(self._decks_cache))
+        old_sigs = self._deck_sigs or ()
+        self._deck_sigs = tuple(_deck_signature(deck) for deck in self._decks_cache)
+        
+        if self._deck_sigs == old_sigs and self.deck_cards:
+            # Same decks as shown: only the selection resets
+            with BaseDeckCardWidget.batch_updates():
+                for card in self.deck_cards:
+                    if hasattr(card, 'set_selected'):
+                        card.set_selected(False)
+            return
         
-        # Clear existing cards
-        for card in self.deck_cards:
-            card.deleteLater()
-        self.deck_cards.clear()
-        self.deck_cards_layout.clear_cards()
-        self.selected_deck_ids.clear()
+        self.deck_cards = []
+        self._deck_ids = [deck['id'] for deck in self._decks_cache]
+        self._deck_names = [deck['name'] for deck in self._decks_cache]
+        self._id_to_index = {deck_id: i for i, deck_id in enumerate(self._deck_ids)}
         
         if not decks:
-            # Show no decks message
+            # Detach existing cards and show no decks message
+            self.deck_cards_layout.clear_cards()
+            self._trim_card_pool(0)
             self._show_no_decks_message()
             return
         
-        # Store deck names for reference
-        self.deck_id_to_name = {deck['id']: deck['name'] for deck in self._decks_cache}
-        
         # Add create deck card for management mode
         if self.mode == DeckGalleryMode.MANAGEMENT:
             self._add_create_deck_card()
         
-        # Create and add deck cards based on mode
-        for deck in self._decks_cache:
-            deck_card = self._create_deck_card(deck)
-            if deck_card:
+        # Rebind pooled cards whose deck changed; only build cards the pool lacks
+        with BaseDeckCardWidget.batch_updates():
+            for i, deck in enumerate(self._decks_cache):
+                if i < len(self._card_pool):
+                    deck_card = self._card_pool[i]
+                    if i < len(old_sigs) and old_sigs[i] == self._deck_sigs[i]:
+                        if hasattr(deck_card, 'set_selected'):
+                            deck_card.set_selected(False)
+                    else:
+                        deck_card.set_deck(deck)
+                else:
+                    deck_card = self._create_deck_card(deck)
+                    if not deck_card:
+                        continue
+                    self._card_pool.append(deck_card)
                 self.deck_cards.append(deck_card)
-                self.deck_cards_layout.add_card(deck_card)
+        self._trim_card_pool(len(self._decks_cache))
+        
+        # Lay out the new card list in one pass
+        self.deck_cards_layout.set_cards(self.deck_cards)
         
-        # Force layout update
-        self.deck_cards_layout._recalculate_layout()
+    def _trim_card_pool(self, needed):
+        """Delete pooled cards beyond needed plus CARD_POOL_SPARE"""
+        keep = needed + CARD_POOL_SPARE
+        for card in self._card_pool[keep:]:
+            card.deleteLater()
+        del self._card_pool[keep:]
         
     def _show_no_decks_message(self):
         """Show a message when no decks are available"""
@@ -215,68 +364,80 @@ class DeckGalleryWidget(QWidget):
         
     def _add_create_deck_card(self):
         """Add create deck card for management mode"""
-        from src.widgets.deck_card_widgets import CreateDeckCardWidget
-        create_card = CreateDeckCardWidget()
-        create_card.create_deck.connect(self.deck_create.emit)
-        self.deck_cards.append(create_card)
-        self.deck_cards_layout.add_card(create_card)
+        if self._create_card is None:
+            self._create_card = CreateDeckCardWidget()
+            self._create_card.card_action.connect(self._on_card_action, Qt.QueuedConnection)
+        self.deck_cards.append(self._create_card)
         
     def _create_deck_card(self, deck):
         """Create a deck card widget based on the current mode"""
-        if self.mode == DeckGalleryMode.STUDY:
-            from src.widgets.deck_card_widgets import StudyDeckCardWidget
-            card = StudyDeckCardWidget(deck)
-            card.deck_selected.connect(self._handle_deck_selection)
-            card.preview_requested.connect(self.deck_preview.emit)
-            return card
-            
-        elif self.mode == DeckGalleryMode.MANAGEMENT:
-            from src.widgets.deck_card_widgets import ManagementDeckCardWidget
-            card = ManagementDeckCardWidget(deck)
-            card.deck_selected.connect(self.deck_selected.emit)
-            card.edit_deck.connect(self.deck_edit.emit)
-            card.delete_deck.connect(self.deck_delete.emit)
-            return card
-            
-        elif self.mode == DeckGalleryMode.SELECTION:
-            from src.widgets.deck_card_widgets import SelectionDeckCardWidget
-            card = SelectionDeckCardWidget(deck)
-            card.deck_selected.connect(self.deck_selected.emit)
-            return card
-            
-        return None
+        if self.mode not in self._card_ctor:
+            return None
+        card = self._card_ctor[self.mode](deck)
+        # Card actions are queued so the press is painted before the page
+        # switches or a dialog opens
+        card.card_action.connect(self._on_card_action, Qt.QueuedConnection)
+        return card
+        
+    @Slot(int, str)
+    def _on_card_action(self, deck_id, action):
+        """Route a card's (deck id, action) to the handler for the current mode"""
+        handler = self._card_actions[self.mode].get(action)
+        if handler:
+            handler(deck_id)
         
     def _handle_deck_selection(self, deck_id):
         """Handle deck selection for multi-select modes"""
         if self.mode == DeckGalleryMode.STUDY:
-            # Toggle selection
-            if deck_id in self.selected_deck_ids:
-                self.selected_deck_ids.remove(deck_id)
-            else:
-                self.selected_deck_ids.add(deck_id)
-                
-            # Emit signals
-            self.deck_selected.emit(deck_id)
-            self.selection_changed.emit(list(self.selected_deck_ids))
+            # Toggle selection; ignore actions queued for decks removed by a refresh since the click
+            index = self._id_to_index.get(deck_id)
+            if index is None:
+                return
+            self._selected[index] ^= 1
             
+            # Emit signals
+            if self._take_selection_change():
+                self.deck_selected.emit(deck_id)
+                self.selection_changed.emit(self.get_selected_deck_ids())
+                
+    def _take_selection_change(self):
+        """Whether the selection differs from the last one emitted; records it"""
+        current = frozenset(self.get_selected_deck_ids())
+        if current == self._last_emitted_selection:
+            return False
+        self._last_emitted_selection = current
+        return True
+        
     def clear_selection(self):
         """Clear all deck selections"""
-        self.selected_deck_ids.clear()
-        for card in self.deck_cards:
-            if hasattr(card, 'set_selected'):
-                card.set_selected(False)
-        self.selection_changed.emit([])
+        self._selected = bytearray(len(self._deck_ids))
+        with BaseDeckCardWidget.batch_updates():
+            for card in self.deck_cards:
+                if hasattr(card, 'set_selected'):
+                    card.set_selected(False)
+        if self._take_selection_change():
+            self.selection_changed.emit([])
         
     def get_selected_deck_ids(self):
         """Get list of currently selected deck IDs"""
-        return list(self.selected_deck_ids)
+        return [deck_id for deck_id, selected in zip(self._deck_ids, self._selected) if selected]
         
     def set_mode(self, mode: DeckGalleryMode):
         """Change the gallery mode and refresh"""
         if self.mode != mode:
             self.mode = mode
+            # Pooled cards belong to the old mode; refresh_decks detaches them
+            # from the grid before they are deleted
+            old_cards = self._card_pool
+            if self._create_card is not None:
+                old_cards.append(self._create_card)
+            self._card_pool = []
+            self._create_card = None
+            self._deck_sigs = None
             if hasattr(self, '_decks_cache'):
                 self.refresh_decks(self._decks_cache)
+            for card in old_cards:
+                card.deleteLater()
                 
     def set_title(self, title: str):
         """Update the title text"""
@@ -294,9 +455,13 @@ class DeckGalleryWidget(QWidget):
     
     def start_title_animation(self):
         """Start the typing animation (study mode only)"""
-        if self.mode != DeckGalleryMode.STUDY:
+        # The delayed start from showEvent may land after the gallery was hidden
+        if self.mode != DeckGalleryMode.STUDY or not self._is_visible:
             return
-            
+        
+        # Drop any typing or glow still running from a previous start
+        self.stop_title_animation()
+        
         # Reset typing state
         self._typing_index = 0
         self.title_label.setText("")
@@ -310,8 +475,7 @@ class DeckGalleryWidget(QWidget):
         """Update the typing animation"""
         if self._typing_index < len(self._typing_text):
             # Add next character
-            current_text = self._typing_text[:self._typing_index + 1]
-            self.title_label.setText(current_text)
+            self.title_label.setText(self.title_label.text() + self._typing_text[self._typing_index])
             self._typing_index += 1
         else:
             # Typing complete, start pulsing glow
@@ -320,85 +484,94 @@ class DeckGalleryWidget(QWidget):
             
     def _start_glow_animation(self):
         """Start the pulsing glow animation after typing is complete"""
-        # Create shadow effect for glow
+        # Create shadow effect for glow; low power mode pulses the color only
+        if not self._low_power:
+            self._create_glow_shadow()
+        
+        # Shared table of precomputed frames, built on first use
+        self._glow_frames = _title_glow_frames()
+        
+        # Qt's animation clock drives the pulse; frames are looked up, not computed
+        if self._glow_anim is None:
+            self._glow_anim = QVariantAnimation(self)
+            self._glow_anim.setStartValue(0.0)
+            self._glow_anim.setEndValue(1.0)
+            self._glow_anim.setDuration(GLOW_PERIOD_MS)
+            self._glow_anim.setLoopCount(-1)
+            self._glow_anim.setEasingCurve(QEasingCurve.Linear)
+            self._glow_anim.valueChanged.connect(self._apply_glow)
+        self._glow_frame = -1
+        self._glow_anim.start()
+        
+    def _create_glow_shadow(self):
+        """Attach the drop shadow the glow animates"""
         self._shadow_effect = QGraphicsDropShadowEffect()
         self._shadow_effect.setBlurRadius(15)
         self._shadow_effect.setOffset(0, 0)
         self.title_label.setGraphicsEffect(self._shadow_effect)
         
-        # Start the glow timer
-        self._animation_timer = QTimer()
-        self._animation_timer.timeout.connect(self._update_title_animation)
-        self._animation_timer.start(50)  # 20 FPS
-        
-    def _update_title_animation(self):
-        """Update the title animation with pulsing glow"""
-        import math
-        
-        # Increment glow phase
-        self._glow_phase += 0.1
-        if self._glow_phase > 2 * math.pi:
-            self._glow_phase = 0
-        
-        # Calculate pulsing values
-        pulse_intensity = 0.3 + 0.2 * math.sin(self._glow_phase)
-        glow_intensity = 0.7 + 0.3 * math.sin(self._glow_phase * 0.7)
-        
-        # Create animated colors - Gold theme
-        base_color = QColor(255, 215, 0)  # Gold
-        glow_color = QColor(255, 69, 0)   # Red-orange glow
+    def _remove_glow_shadow(self):
+        """Detach the glow's drop shadow, if any"""
+        if self._shadow_effect:
+            self.title_label.setGraphicsEffect(None)
+            self._shadow_effect = None
+            
+    def set_low_power_mode(self, enabled: bool):
+        """Animate the title glow without the drop shadow blur"""
+        self._low_power = enabled
+        glowing = self._glow_anim is not None and self._glow_anim.state() == QVariantAnimation.Running
+        if not glowing:
+            return
+        if enabled:
+            self._remove_glow_shadow()
+        elif self._shadow_effect is None:
+            self._create_glow_shadow()
+            self._glow_frame = -1  # Restyle the new shadow on the next frame
+            
+    @Slot(object)
+    def _apply_glow(self, progress):
+        """Show the glow frame for the pulse progress (0..1)"""
+        # Nothing to restyle while behind another page or minimized
+        if not self.isVisible() or self.window().isMinimized():
+            return
         
-        # Mix colors based on pulse
-        final_color = QColor(
-            int(base_color.red() * (1 - pulse_intensity) + glow_color.red() * pulse_intensity),
-            int(base_color.green() * (1 - pulse_intensity) + glow_color.green() * pulse_intensity),
-            int(base_color.blue() * (1 - pulse_intensity) + glow_color.blue() * pulse_intensity)
-        )
+        # Only touch the label when the animation reaches a new frame
+        frame = int(progress * GLOW_FRAMES) % GLOW_FRAMES
+        if frame == self._glow_frame:
+            return
+        self._glow_frame = frame
+        text_color, shadow_color, blur_radius = self._glow_frames[self._glow_frame]
         
         # Update shadow effect for glow
         if self._shadow_effect:
-            glow_color_with_alpha = QColor(glow_color.red(), glow_color.green(), glow_color.blue(), int(100 * pulse_intensity))
-            self._shadow_effect.setColor(glow_color_with_alpha)
-            self._shadow_effect.setBlurRadius(int(15 * pulse_intensity))
-        
-        # Apply animated styling
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                color: rgba({final_color.red()}, {final_color.green()}, {final_color.blue()}, {glow_intensity});
-                font-size: 24px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-                outline: none;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                margin: 15px 0px;
-                padding: 0px;
-                letter-spacing: 2px;
-            }}
-        """)
+            self._shadow_effect.setColor(shadow_color)
+            self._shadow_effect.setBlurRadius(blur_radius)
+        
+        # Only the text color changes; the title stylesheet is never reparsed
+        self.title_label.set_text_color(text_color)
         
     def stop_title_animation(self):
         """Stop the title animation"""
-        if self._animation_timer:
-            self._animation_timer.stop()
-            self._animation_timer = None
+        if self._glow_anim:
+            self._glow_anim.stop()
         
         if self._typing_timer:
             self._typing_timer.stop()
             self._typing_timer = None
         
-        if self._shadow_effect:
-            self.title_label.setGraphicsEffect(None)
-            self._shadow_effect = None
+        if self._glow_anim or self._shadow_effect:
+            self._remove_glow_shadow()
+            self.title_label.set_text_color(None)
             
     # ==================== EVENT HANDLERS ====================
     
     def resizeEvent(self, event):
         """Handle resize events to update grid layout"""
         super().resizeEvent(event)
-        # Trigger grid layout recalculation when the gallery is resized
-        if hasattr(self, 'deck_cards_layout') and self.deck_cards_layout:
-            self.deck_cards_layout._recalculate_layout()
+        # Recalculate the grid once the resize burst settles; each new resize
+        # event restarts the timer
+        if hasattr(self, '_resize_timer'):
+            self._resize_timer.start()
     
     def showEvent(self, event):
         """Handle widget show event - start animation when visible"""
@@ -410,7 +583,7 @@ class DeckGalleryWidget(QWidget):
                 QTimer.singleShot(150, self.start_title_animation)
     
     def hideEvent(self, event):
-        """Handle widget hide event - stop animation when hidden"""
+        """Handle widget hide event - stop animation when hidden or minimized"""
         super().hideEvent(event)
         if self._is_visible:
             self._is_visible = False
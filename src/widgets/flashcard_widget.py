@@ -5,8 +5,231 @@ Includes flip animation and study controls
 
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                                QPushButton, QTextEdit, QFrame, QSizePolicy)
-from PySide6.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, Signal
-from PySide6.QtGui import QFont, QPainter, QPen, QBrush, QColor
+from PySide6.QtCore import Qt, QPropertyAnimation, QRect, QEasingCurve, Signal, Slot, QEvent, QPointF, QRectF
+from PySide6.QtGui import (QFont, QPainter, QPen, QBrush, QColor, QPixmap,
+                           QStaticText, QTextOption, QTransform)
+
+# Stylesheets shared by every flashcard, built once at import
+_CARD_QSS = """
+    QWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(45, 45, 45, 0.95),
+            stop:1 rgba(30, 30, 30, 0.95));
+        border-radius: 15px;
+        border: 2px solid rgba(255, 255, 255, 0.2);
+    }
+"""
+
+_CONTENT_FRAME_QSS = """
+    QFrame {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(60, 60, 60, 0.8),
+            stop:1 rgba(40, 40, 40, 0.8));
+        border-radius: 10px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }
+"""
+
+_CARD_TEXT_QSS = """
+    QLabel {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        padding: 10px;
+        background: transparent;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+"""
+
+_PANE_QSS = """
+    QFrame {
+        background: rgba(30, 30, 30, 0.6);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+        border-radius: 8px;
+    }
+"""
+
+_PANE_TITLE_QSS = """
+    QLabel {
+        color: rgba(255,255,255,0.7);
+        font-size: 12px;
+        font-weight: bold;
+        background: transparent;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+"""
+
+_FLIP_BTN_QSS = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #64c8ff,
+            stop:1 #4a9eff);
+        color: white;
+        border: none;
+        padding: 12px 24px;
+        border-radius: 8px;
+        font-size: 16px;
+        font-weight: bold;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #5ab8ff,
+            stop:1 #3d8eff);
+    }
+"""
+
+# Study rating buttons, worst to best
+_RATING_LABELS = ["Again", "Hard", "Good", "Easy", "Perfect"]
+_RATING_COLORS = ["#ff6b6b", "#ffa726", "#ffeb3b", "#66bb6a", "#42a5f5"]
+
+# Hand-picked darker / lighter shade of each rating color for the button gradients;
+# colors missing here are shaded arithmetically
+_DARKER = {
+    "#ff6b6b": "#ff5252",
+    "#ffa726": "#ff9800",
+    "#ffeb3b": "#fdd835",
+    "#66bb6a": "#4caf50",
+    "#42a5f5": "#2196f3"
+}
+_LIGHTER = {
+    "#ff6b6b": "#ff8a80",
+    "#ffa726": "#ffb74d",
+    "#ffeb3b": "#fff176",
+    "#66bb6a": "#81c784",
+    "#42a5f5": "#64b5f6"
+}
+
+
+def _shade(hex_color: str, factor: float) -> str:
+    """Scale the RGB channels of a #rrggbb color, clamped to 255"""
+    value = int(hex_color[1:], 16)
+    r = min(255, int(((value >> 16) & 0xFF) * factor))
+    g = min(255, int(((value >> 8) & 0xFF) * factor))
+    b = min(255, int((value & 0xFF) * factor))
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+
+# One stylesheet for the whole rating bar; buttons pick their colors by rating property
+_RATING_BAR_QSS = """
+    QPushButton {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-size: 14px;
+        font-weight: bold;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+""" + "".join(f"""
+    QPushButton[rating="{i}"] {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {color},
+            stop:1 {_DARKER.get(color) or _shade(color, 0.85)});
+    }}
+    QPushButton[rating="{i}"]:hover {{
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 {_LIGHTER.get(color) or _shade(color, 1.15)},
+            stop:1 {color});
+    }}
+""" for i, color in enumerate(_RATING_COLORS))
+
+
+
+
+class RatingBar(QWidget):
+    """Row of study rating buttons, worst to best
+
+    A single bar can be handed to several flashcards; it moves under
+    whichever card is currently showing its ratings.
+    """
+    
+    rating_selected = Signal(int)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Paint the card's QWidget rule like the plain container it replaces
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(_RATING_BAR_QSS)
+        layout = QHBoxLayout(self)
+        layout.setSpacing(10)
+        
+        self.buttons = []
+        for i, label in enumerate(_RATING_LABELS):
+            btn = QPushButton(label)
+            btn.setProperty("rating", i)
+            btn.clicked.connect(self._on_button_clicked)
+            self.buttons.append(btn)
+            layout.addWidget(btn)
+            
+    @Slot()
+    def _on_button_clicked(self):
+        """Emit the rating stored on the clicked button"""
+        self.rating_selected.emit(self.sender().property("rating"))
+
+
+class _StaticTextLabel(QLabel):
+    """Label that keeps the laid-out text of the card faces it has shown
+
+    Flipping swaps between the same two strings, so each face is shaped
+    once into a QStaticText and later flips only redraw it.
+    """
+    
+    _CACHE_SIZE = 2
+    
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(text, parent)
+        self._static_texts = {}
+        
+    def setText(self, text: str):
+        # QLabel keeps the text for size hints and accessibility; only painting is cached
+        if text != self.text():
+            super().setText(text)
+            
+    def _static_text(self) -> QStaticText:
+        """Return the prepared layout for the current text"""
+        text = self.text()
+        static = self._static_texts.get(text)
+        if static is None:
+            if len(self._static_texts) >= self._CACHE_SIZE:
+                del self._static_texts[next(iter(self._static_texts))]
+            option = QTextOption(self.alignment())
+            option.setWrapMode(QTextOption.WordWrap if self.wordWrap() else QTextOption.NoWrap)
+            static = QStaticText(text)
+            static.setTextOption(option)
+            static.setTextWidth(self.contentsRect().width())
+            static.prepare(QTransform(), self.font())
+            self._static_texts[text] = static
+        return static
+        
+    def resizeEvent(self, event):
+        """Wrapping depends on the width, so drop layouts on resize"""
+        self._static_texts.clear()
+        super().resizeEvent(event)
+        
+    def changeEvent(self, event):
+        """Drop layouts when the stylesheet or font changes"""
+        if event.type() in (QEvent.FontChange, QEvent.StyleChange):
+            self._static_texts.clear()
+        super().changeEvent(event)
+        
+    def paintEvent(self, event):
+        """Draw the frame as usual, then the cached text layout in place of QLabel's"""
+        QFrame.paintEvent(self, event)
+        if not self.text():
+            return
+        static = self._static_text()
+        rect = self.contentsRect()
+        y = rect.top()
+        if self.alignment() & Qt.AlignVCenter:
+            y += (rect.height() - static.size().height()) / 2
+        elif self.alignment() & Qt.AlignBottom:
+            y += rect.height() - static.size().height()
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(QPointF(rect.left(), y), static)
+        painter.end()
+
 
 class FlashcardWidget(QWidget):
     """Widget for displaying individual flashcards with flip animation"""
@@ -15,27 +238,27 @@ class FlashcardWidget(QWidget):
     card_flipped = Signal(bool)  # True when showing back, False when showing front
     study_rating = Signal(int)   # Rating from 0-5 for spaced repetition
     
-    def __init__(self, front_text: str = "", back_text: str = "", parent=None, side_by_side: bool = False):
+    # Card chrome styling, shared by every card
+    _SHADOW_COLOR = QColor(0, 0, 0, 60)
+    _CARD_BRUSH = QBrush(QColor(45, 45, 45))
+    _CARD_PEN = QPen(QColor(255, 255, 255, 50), 2)
+    
+    def __init__(self, front_text: str = "", back_text: str = "", parent=None, side_by_side: bool = False,
+                 rating_bar: RatingBar = None):
         super().__init__(parent)
+        self._shared_rating_bar = rating_bar
         self.front_text = front_text
         self.back_text = back_text
         self.is_flipped = False
         self.side_by_side = side_by_side
+        self._bg_pixmap = None  # Card chrome, rendered on first paint after a resize
         self.init_ui()
         self.setup_animations()
         
     def init_ui(self):
         """Initialize the flashcard UI"""
         self.setFixedSize(800 if self.side_by_side else 600, 400)
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(45, 45, 45, 0.95),
-                    stop:1 rgba(30, 30, 30, 0.95));
-                border-radius: 15px;
-                border: 2px solid rgba(255, 255, 255, 0.2);
-            }
-        """)
+        self.setStyleSheet(_CARD_QSS)
         
         # Main layout
         layout = QVBoxLayout(self)
@@ -44,37 +267,40 @@ class FlashcardWidget(QWidget):
         
         # Card content area
         self.content_frame = QFrame()
-        self.content_frame.setStyleSheet("""
-            QFrame {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(60, 60, 60, 0.8),
-                    stop:1 rgba(40, 40, 40, 0.8));
-                border-radius: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-        """)
+        self.content_frame.setStyleSheet(_CONTENT_FRAME_QSS)
         self.content_frame.setMinimumHeight(250)
         
         content_layout = QVBoxLayout(self.content_frame)
         content_layout.setContentsMargins(20, 20, 20, 20)
         
         # Single label view
-        self.card_label = QLabel()
+        self.card_label = _StaticTextLabel()
         self.card_label.setAlignment(Qt.AlignCenter)
         self.card_label.setWordWrap(True)
-        self.card_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                padding: 10px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.card_label.setStyleSheet(_CARD_TEXT_QSS)
         content_layout.addWidget(self.card_label)
         
-        # Side-by-side view container
+        # Side-by-side panes are built the first time they are shown
+        self.content_layout = content_layout
+        self.two_col_container = None
+        
+        layout.addWidget(self.content_frame)
+        
+        # Flip button
+        self.flip_button = QPushButton("Show Answer")
+        self.flip_button.setStyleSheet(_FLIP_BTN_QSS)
+        self.flip_button.clicked.connect(self.flip_card)
+        layout.addWidget(self.flip_button)
+        
+        # Study rating buttons are built (or the shared bar adopted) the first time they are shown
+        self.rating_container = None
+        self.rating_buttons = []
+        
+        # Set initial content
+        self.update_content()
+        
+    def _build_two_col(self):
+        """Create the side-by-side question and answer panes"""
         self.two_col_container = QWidget()
         two_col_layout = QHBoxLayout(self.two_col_container)
         two_col_layout.setContentsMargins(0, 0, 0, 0)
@@ -82,26 +308,12 @@ class FlashcardWidget(QWidget):
         
         def build_pane(title: str) -> QVBoxLayout:
             pane = QFrame()
-            pane.setStyleSheet("""
-                QFrame {
-                    background: rgba(30, 30, 30, 0.6);
-                    border: 1px solid rgba(255, 255, 255, 0.1);
-                    border-radius: 8px;
-                }
-            """)
+            pane.setStyleSheet(_PANE_QSS)
             pane_layout = QVBoxLayout(pane)
             pane_layout.setContentsMargins(12, 12, 12, 12)
             title_label = QLabel(title)
             title_label.setAlignment(Qt.AlignLeft)
-            title_label.setStyleSheet("""
-                QLabel {
-                    color: rgba(255,255,255,0.7);
-                    font-size: 12px;
-                    font-weight: bold;
-                    background: transparent;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                }
-            """)
+            title_label.setStyleSheet(_PANE_TITLE_QSS)
             pane_layout.addWidget(title_label)
             return pane, pane_layout
         
@@ -110,82 +322,38 @@ class FlashcardWidget(QWidget):
         
         self.left_label = QLabel()
         self.left_label.setWordWrap(True)
-        self.left_label.setStyleSheet(self.card_label.styleSheet())
+        self.left_label.setStyleSheet(_CARD_TEXT_QSS)
         self.right_label = QLabel()
         self.right_label.setWordWrap(True)
-        self.right_label.setStyleSheet(self.card_label.styleSheet())
+        self.right_label.setStyleSheet(_CARD_TEXT_QSS)
         self.left_layout.addWidget(self.left_label)
         self.right_layout.addWidget(self.right_label)
         two_col_layout.addWidget(self.left_pane)
         two_col_layout.addWidget(self.right_pane)
-        content_layout.addWidget(self.two_col_container)
+        self.content_layout.addWidget(self.two_col_container)
         
-        layout.addWidget(self.content_frame)
+    def _adopt_rating_bar(self):
+        """Move the rating bar below the flip button and route its ratings here"""
+        bar = self.rating_container
+        owner = bar.parentWidget()
+        if isinstance(owner, FlashcardWidget):
+            bar.rating_selected.disconnect(owner.rate_card)
+        self.layout().addWidget(bar)
+        bar.rating_selected.connect(self.rate_card)
         
-        # Flip button
-        self.flip_button = QPushButton("Show Answer")
-        self.flip_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #64c8ff,
-                    stop:1 #4a9eff);
-                color: white;
-                border: none;
-                padding: 12px 24px;
-                border-radius: 8px;
-                font-size: 16px;
-                font-weight: bold;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #5ab8ff,
-                    stop:1 #3d8eff);
-            }
-        """)
-        self.flip_button.clicked.connect(self.flip_card)
-        layout.addWidget(self.flip_button)
-        
-        # Study rating buttons (initially hidden)
-        # Wrap layout in a QWidget container so we can toggle visibility
-        self.rating_container = QWidget()
-        self.rating_layout = QHBoxLayout(self.rating_container)
-        self.rating_layout.setSpacing(10)
-        
-        self.rating_buttons = []
-        rating_labels = ["Again", "Hard", "Good", "Easy", "Perfect"]
-        rating_colors = ["#ff6b6b", "#ffa726", "#ffeb3b", "#66bb6a", "#42a5f5"]
-        
-        for i, (label, color) in enumerate(zip(rating_labels, rating_colors)):
-            btn = QPushButton(label)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {color},
-                        stop:1 {self.darken_color(color)});
-                    color: white;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 6px;
-                    font-size: 14px;
-                    font-weight: bold;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                }}
-                QPushButton:hover {{
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 {self.lighten_color(color)},
-                        stop:1 {color});
-                }}
-            """)
-            btn.clicked.connect(lambda checked, rating=i: self.rate_card(rating))
-            self.rating_buttons.append(btn)
-            self.rating_layout.addWidget(btn)
-            
-        layout.addWidget(self.rating_container)
-        self.rating_container.setVisible(False)
-        
-        # Set initial content
-        self.update_content()
+    def _set_ratings_visible(self, visible: bool):
+        """Show or hide the rating buttons, building them on first show"""
+        if self.rating_container is None:
+            if not visible:
+                return
+            self.rating_container = self._shared_rating_bar or RatingBar()
+            self.rating_buttons = self.rating_container.buttons
+        if self.rating_container.parentWidget() is not self:
+            # A shared bar showing under another card is left alone
+            if not visible:
+                return
+            self._adopt_rating_bar()
+        self.rating_container.setVisible(visible)
         
     def setup_animations(self):
         """Setup flip animations"""
@@ -193,49 +361,31 @@ class FlashcardWidget(QWidget):
         self.flip_animation.setDuration(300)
         self.flip_animation.setEasingCurve(QEasingCurve.InOutQuad)
         
-    def darken_color(self, color: str) -> str:
-        """Darken a hex color for hover effects"""
-        color_map = {
-            "#ff6b6b": "#ff5252",
-            "#ffa726": "#ff9800", 
-            "#ffeb3b": "#fdd835",
-            "#66bb6a": "#4caf50",
-            "#42a5f5": "#2196f3"
-        }
-        return color_map.get(color, color)
-        
-    def lighten_color(self, color: str) -> str:
-        """Lighten a hex color for hover effects"""
-        color_map = {
-            "#ff6b6b": "#ff8a80",
-            "#ffa726": "#ffb74d", 
-            "#ffeb3b": "#fff176",
-            "#66bb6a": "#81c784",
-            "#42a5f5": "#64b5f6"
-        }
-        return color_map.get(color, color)
-        
     def set_card_content(self, front_text: str, back_text: str):
         """Set the card content"""
         self.front_text = front_text
         self.back_text = back_text
-        self.is_flipped = False
-        self.update_content()
+        # reset_ui_state clears the flip and refreshes the labels once
         self.reset_ui_state()
 
     def set_side_by_side(self, enabled: bool):
         """Toggle side-by-side display mode"""
         self.side_by_side = enabled
+        # Resize and swap views as one change, repainted once at the end
+        self.setUpdatesEnabled(False)
         self.setFixedSize(800 if self.side_by_side else 600, 400)
         self.update_content()
         # In side-by-side view, show ratings immediately and hide flip
-        self.rating_container.setVisible(self.side_by_side)
+        self._set_ratings_visible(self.side_by_side)
         self.flip_button.setVisible(not self.side_by_side)
+        self.setUpdatesEnabled(True)
         
     def update_content(self):
         """Update the displayed content based on flip state"""
         if self.side_by_side:
             # Show both columns
+            if self.two_col_container is None:
+                self._build_two_col()
             self.card_label.setVisible(False)
             self.two_col_container.setVisible(True)
             self.left_label.setText(self.front_text)
@@ -244,7 +394,8 @@ class FlashcardWidget(QWidget):
         else:
             # Single label with flip behavior
             self.card_label.setVisible(True)
-            self.two_col_container.setVisible(False)
+            if self.two_col_container is not None:
+                self.two_col_container.setVisible(False)
             if self.is_flipped:
                 self.card_label.setText(self.back_text)
                 self.flip_button.setText("Show Question")
@@ -262,10 +413,10 @@ class FlashcardWidget(QWidget):
         
         # Show rating buttons when showing back
         if self.is_flipped:
-            self.rating_container.setVisible(True)
+            self._set_ratings_visible(True)
             self.flip_button.setVisible(False)
         else:
-            self.rating_container.setVisible(False)
+            self._set_ratings_visible(False)
             self.flip_button.setVisible(True)
             
     def rate_card(self, rating: int):
@@ -278,27 +429,53 @@ class FlashcardWidget(QWidget):
         self.is_flipped = False
         self.update_content()
         if self.side_by_side:
-            self.rating_container.setVisible(True)
+            self._set_ratings_visible(True)
             self.flip_button.setVisible(False)
         else:
-            self.rating_container.setVisible(False)
+            self._set_ratings_visible(False)
             self.flip_button.setVisible(True)
         
-    def paintEvent(self, event):
-        """Custom paint event for card styling"""
-        painter = QPainter(self)
+    def resizeEvent(self, event):
+        """Drop the cached card chrome when the size changes"""
+        self._bg_pixmap = None
+        super().resizeEvent(event)
+        
+    def _render_background(self):
+        """Render the card shadow, background and border into a pixmap"""
+        dpr = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * dpr)
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
         # Draw card shadow
         shadow_rect = self.rect().adjusted(8, 8, 0, 0)
-        painter.fillRect(shadow_rect, QColor(0, 0, 0, 60))
+        painter.fillRect(shadow_rect, self._SHADOW_COLOR)
         
-        # Draw card background with gradient
+        # Draw card background
         card_rect = self.rect().adjusted(0, 0, -8, -8)
-        gradient = QBrush(QColor(45, 45, 45))
-        painter.setBrush(gradient)
-        painter.setPen(QPen(QColor(255, 255, 255, 50), 2))
+        painter.setBrush(self._CARD_BRUSH)
+        painter.setPen(self._CARD_PEN)
         painter.drawRoundedRect(card_rect, 15, 15)
         
+        painter.end()
+        return pixmap
+        
+    def paintEvent(self, event):
+        """Custom paint event for card styling"""
+        # Nothing to draw while the card is fully covered or clipped away
+        if self.visibleRegion().isEmpty():
+            return
+        # The chrome only changes with the size, so paints reuse one pixmap
+        if self._bg_pixmap is None:
+            self._bg_pixmap = self._render_background()
+        # Only blit the exposed part; a flip or hover repaints a small rect
+        rect = event.rect()
+        dpr = self._bg_pixmap.devicePixelRatio()
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        painter = QPainter(self)
+        painter.drawPixmap(QRectF(rect), self._bg_pixmap, source)
         painter.end()
         super().paintEvent(event)
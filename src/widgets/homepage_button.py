@@ -1,9 +1,43 @@
+from functools import lru_cache
+
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QPoint
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap
 
 from src.core.paths import asset_path
 
+# Stylesheets shared by every homepage button, built once at import
+_LOGO_QSS = """
+    QLabel {
+        background: transparent;
+        border: none;
+        padding: 0px;
+    }
+"""
+
+_TEXT_QSS = """
+    QLabel {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        background: transparent;
+        border: none;
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+"""
+
+
+@lru_cache(maxsize=8)
+def _load_logo_pixmap(path: str, width: int, height: int, dpr: float):
+    """Load and smooth-scale the logo once, shared by every homepage button"""
+    pixmap = QPixmap(path)
+    if pixmap.isNull():
+        return None
+    pixmap = pixmap.scaled(round(width * dpr), round(height * dpr),
+                           Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
 
 class HomepageButton(QWidget):
     """Clickable brand widget combining app logo and text.
@@ -19,11 +53,8 @@ class HomepageButton(QWidget):
         self._text = text
         self._init_ui()
         
-        # Animation setup for gentle hover jump
+        # Resting position while hovered (6px "jump" is a plain move, no animation)
         self._rest_pos = None
-        self._hover_anim = QPropertyAnimation(self, b"pos")
-        self._hover_anim.setDuration(140)
-        self._hover_anim.setEasingCurve(QEasingCurve.OutQuad)
 
     def _init_ui(self):
         self.setCursor(Qt.PointingHandCursor)
@@ -37,32 +68,17 @@ class HomepageButton(QWidget):
 
         self.logo_label = QLabel()
         self.logo_label.setFixedSize(36, 36)
-        self.logo_label.setStyleSheet("""
-            QLabel {
-                background: transparent;
-                border: none;
-                padding: 0px;
-            }
-        """)
+        self.logo_label.setStyleSheet(_LOGO_QSS)
 
         # Use official DoroLexus logo
         logo_path = asset_path("data", "images", "svg", "doro_lexus logo.svg")
         if logo_path:
-            pixmap = QPixmap(logo_path)
-            if not pixmap.isNull():
-                self.logo_label.setPixmap(pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+            pixmap = _load_logo_pixmap(logo_path, 32, 32, self.devicePixelRatioF())
+            if pixmap is not None:
+                self.logo_label.setPixmap(pixmap)
 
         self.text_label = QLabel(self._text)
-        self.text_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-                border: none;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.text_label.setStyleSheet(_TEXT_QSS)
 
         layout.addWidget(self.logo_label)
         layout.addWidget(self.text_label)
@@ -74,20 +90,15 @@ class HomepageButton(QWidget):
 
     def enterEvent(self, event):
         # Capture exact rest position to avoid drift
-        self._rest_pos = self.pos()
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self.pos())
-        self._hover_anim.setEndValue(QPoint(self._rest_pos.x(), self._rest_pos.y() - 6))
-        self._hover_anim.start()
+        if self._rest_pos is None:
+            self._rest_pos = self.pos()
+            self.move(self._rest_pos.x(), self._rest_pos.y() - 6)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
-        if self._rest_pos is None:
-            self._rest_pos = self.pos()
-        self._hover_anim.stop()
-        self._hover_anim.setStartValue(self.pos())
-        self._hover_anim.setEndValue(self._rest_pos)
-        self._hover_anim.start()
+        if self._rest_pos is not None:
+            self.move(self._rest_pos)
+            self._rest_pos = None
         super().leaveEvent(event)
 
 
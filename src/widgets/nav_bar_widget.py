@@ -3,9 +3,11 @@ NavBarWidget - simple top navigation bar with logo, title and sword-styled back
 """
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout, QLabel, QPushButton
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect, QPoint
-from PySide6.QtGui import QPixmap, QIcon
+from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve
+from PySide6.QtGui import QPixmap
 from src.core.paths import asset_path
+from ._icon_cache import cached_icon
+from .homepage_button import HomepageButton
 
 
 class NavBarWidget(QWidget):
@@ -34,7 +36,6 @@ class NavBarWidget(QWidget):
         layout.setSpacing(15)
 
         # Brand area - use reusable HomepageButton
-        from .homepage_button import HomepageButton
         self.homepage_button = HomepageButton("DoroLexus")
         self.homepage_button.clicked.connect(self.home_requested)
         layout.addWidget(self.homepage_button)
@@ -54,6 +55,8 @@ class NavBarWidget(QWidget):
         self.sword_animation = QPropertyAnimation(self.back_btn, b"geometry")
         self.sword_animation.setDuration(200)
         self.sword_animation.setEasingCurve(QEasingCurve.OutQuad)
+        self.sword_animation.finished.connect(self._on_sword_animation_finished)
+        self._rest_rect = None  # Layout geometry of the button while a stab is in progress
         
         self._setup_sword_back_button()
         self.back_btn.clicked.connect(self.back_requested.emit)
@@ -63,7 +66,7 @@ class NavBarWidget(QWidget):
     def _setup_sword_back_button(self):
         sword_path = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
         if sword_path:
-            icon = QIcon(sword_path)
+            icon = cached_icon(sword_path)
             if not icon.isNull():
                 self.back_btn.setIcon(icon)
                 self.back_btn.setText(" Back")
@@ -101,24 +104,29 @@ class NavBarWidget(QWidget):
 
     def _on_sword_hover_enter(self, event):
         """Sword stab animation on hover - thrust forward"""
-        current_rect = self.back_btn.geometry()
+        # Capture exact rest geometry once so rapid hovering cannot drift
+        if self._rest_rect is None:
+            self._rest_rect = self.back_btn.geometry()
         # Move forward (left) by 5 pixels for stab effect
-        stab_rect = QRect(current_rect.x() - 5, current_rect.y(), current_rect.width(), current_rect.height())
-        
-        self.sword_animation.setStartValue(current_rect)
-        self.sword_animation.setEndValue(stab_rect)
+        self.sword_animation.stop()
+        self.sword_animation.setStartValue(self.back_btn.geometry())
+        self.sword_animation.setEndValue(self._rest_rect.translated(-5, 0))
         self.sword_animation.start()
 
     def _on_sword_hover_leave(self, event):
         """Sword return to normal position"""
-        current_rect = self.back_btn.geometry()
-        # Return to original position
-        normal_rect = QRect(current_rect.x() + 5, current_rect.y(), current_rect.width(), current_rect.height())
-        
-        self.sword_animation.setStartValue(current_rect)
-        self.sword_animation.setEndValue(normal_rect)
+        if self._rest_rect is None:
+            return
+        self.sword_animation.stop()
+        self.sword_animation.setStartValue(self.back_btn.geometry())
+        self.sword_animation.setEndValue(self._rest_rect)
         self.sword_animation.start()
 
+    def _on_sword_animation_finished(self):
+        """Forget the rest geometry once the sword is back, so layout changes are picked up"""
+        if self.sword_animation.endValue() == self._rest_rect:
+            self._rest_rect = None
+
     # Public helpers
     def set_title(self, title: str):
         self._title = title
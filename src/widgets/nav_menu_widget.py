@@ -4,6 +4,7 @@ Navigation Menu Widget - Bottom navigation buttons (Statistics, Exit)
 
 from PySide6.QtWidgets import QWidget, QHBoxLayout
 from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPainter
 from .mini_card_widget import MiniCardWidget
 from ..ui.menu_config import MiniCardConfig
 
@@ -18,6 +19,7 @@ class NavMenuWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.mini_card_config = MiniCardConfig()
+        self._is_narrow = None  # Layout mode last applied by resizeEvent
         self.init_ui()
         
     def init_ui(self):
@@ -64,17 +66,27 @@ class NavMenuWidget(QWidget):
         self.exit_card.clicked.connect(self.exit_requested.emit)
         layout.addWidget(self.exit_card)
         
+    def paintEvent(self, event):
+        """Paint the card drop shadows beneath the cards"""
+        painter = QPainter(self)
+        for card in (self.stats_card, self.exit_card):
+            if card.isVisible():
+                card.paint_shadow(painter)
+        painter.end()
+        
     def resizeEvent(self, event):
         """Handle responsive layout changes"""
         super().resizeEvent(event)
         
-        # Get current width
-        current_width = self.width()
-        
-        # Switch to vertical stack on narrow widths
+        # Switch to vertical stack on narrow widths, touching the layout only
+        # when the width crosses the threshold
+        narrow = self.width() < 520
+        if narrow == self._is_narrow:
+            return
+        self._is_narrow = narrow
         layout = self.layout()
         if layout:
-            if current_width < 520:
+            if narrow:
                 layout.setDirection(QHBoxLayout.TopToBottom)
                 layout.setSpacing(20)
             else:
@@ -3,10 +3,90 @@ Independent Responsive Deck Card Widget
 Handles its own positioning and responsive behavior
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QFrame
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QPoint, QTimer, QRect
-from PySide6.QtGui import QFont, QIcon
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QStackedLayout, QLabel,
+                               QPushButton, QFrame)
+from PySide6.QtCore import (Qt, Signal, Slot, QPropertyAnimation, QSequentialAnimationGroup,
+                            QEasingCurve, QPoint, QTimer, QRect)
+from PySide6.QtGui import QFont
 from src.core.paths import asset_path
+from src.widgets._icon_cache import cached_icon, cached_pixmap, prewarm_icons
+
+
+# Artwork shared by every card, rendered once through the icon cache
+_SWORD_SVG = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
+_TOMATO_SVG = asset_path("data", "images", "svg", "tomato-svgrepo-com.svg")
+
+# Every (path, width, height) the cards rasterize, see prewarm_card_artwork
+_CARD_ARTWORK = ((_SWORD_SVG, 64, 64), (_SWORD_SVG, 20, 20))
+
+# Children are styled by object name from the card's stylesheet, so each card parses one sheet
+_CHILDREN_QSS = """
+    ResponsiveDeckCardWidget QLabel { border: none; background: transparent; }
+    ResponsiveDeckCardWidget QWidget#info { background: transparent; }
+    ResponsiveDeckCardWidget QLabel#name {
+        color: white;
+        font-size: 16px;
+        font-weight: bold;
+    }
+    ResponsiveDeckCardWidget QLabel#count {
+        color: rgba(255, 255, 255, 0.7);
+        font-size: 12px;
+    }
+    ResponsiveDeckCardWidget QLabel#due {
+        color: #ff6b6b;
+        font-size: 11px;
+        font-weight: bold;
+    }
+    ResponsiveDeckCardWidget QPushButton#preview {
+        background: transparent;
+        color: #ff6347;
+        border: 2px solid transparent;
+        border-radius: 14px;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 2px;
+    }
+    ResponsiveDeckCardWidget QPushButton#preview:hover {
+        background: rgba(255, 99, 71, 0.2);
+        border: 2px solid rgba(255, 99, 71, 0.6);
+        color: #ff4500;
+    }
+    ResponsiveDeckCardWidget QPushButton#preview:pressed {
+        background: rgba(255, 99, 71, 0.4);
+        border: 2px solid rgba(255, 99, 71, 0.8);
+    }
+"""
+
+# Both selection states in one sheet, set once; selecting only flips the "selected" property
+_CARD_QSS = """
+    ResponsiveDeckCardWidget {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(60, 60, 60, 0.9),
+            stop:1 rgba(40, 40, 40, 0.9));
+        border-radius: 12px;
+        border: none;
+    }
+    ResponsiveDeckCardWidget:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(45, 45, 50, 0.95),
+            stop:1 rgba(25, 25, 30, 0.95));
+    }
+    ResponsiveDeckCardWidget[selected="true"] {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(20, 20, 25, 0.95),
+            stop:1 rgba(10, 10, 15, 0.95));
+    }
+    ResponsiveDeckCardWidget[selected="true"]:hover {
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 rgba(30, 30, 35, 0.95),
+            stop:1 rgba(15, 15, 20, 0.95));
+    }
+""" + _CHILDREN_QSS
+
+
+def prewarm_card_artwork():
+    """Rasterize the sword artwork in the background before a card first needs it"""
+    prewarm_icons(_CARD_ARTWORK)
 
 
 class ResponsiveDeckCardWidget(QFrame):
@@ -23,9 +103,26 @@ class ResponsiveDeckCardWidget(QFrame):
         self.due_count = deck_data.get('due_count', 0)
         self.is_selected = False
         self._is_hovered = False
-        self._jump_animation = None
         self._original_pos = None
         
+        # Jump animation: up quickly, then back down; built once and replayed on every hover
+        self._jump_up = QPropertyAnimation(self, b"pos", self)
+        self._jump_up.setDuration(150)  # Quick jump
+        self._jump_up.setEasingCurve(QEasingCurve.OutCubic)
+        self._jump_down = QPropertyAnimation(self, b"pos", self)
+        self._jump_down.setDuration(100)  # Quick return
+        self._jump_down.setEasingCurve(QEasingCurve.InCubic)
+        self._jump_animation = QSequentialAnimationGroup(self)
+        self._jump_animation.addAnimation(self._jump_up)
+        self._jump_animation.addAnimation(self._jump_down)
+        
+        # Hover changes settle for a moment first, so quick flick-throughs schedule no work
+        self._pending_hover = False
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(30)
+        self._hover_timer.timeout.connect(self._apply_hover_state)
+        
         # Fixed size for consistent layout
         self.setFixedSize(200, 120)
         self.setCursor(Qt.PointingHandCursor)
@@ -35,14 +132,20 @@ class ResponsiveDeckCardWidget(QFrame):
         self._hover_effect = None
         
         self.init_ui()
-        self._update_style()
+        self.setStyleSheet(_CARD_QSS)
         
         # No need to cache position since we're not moving the widget
         
     def init_ui(self):
         """Initialize the deck card UI"""
-        # Main layout
-        layout = QVBoxLayout(self)
+        # The two selection states are stacked pages: deck info (0) and the centered sword (1)
+        self._stack = QStackedLayout(self)
+        self._stack.setContentsMargins(0, 0, 0, 0)
+        
+        # Deck info page
+        info_page = QWidget()
+        info_page.setObjectName("info")
+        layout = QVBoxLayout(info_page)
         layout.setContentsMargins(16, 16, 16, 16)
         layout.setSpacing(8)
         
@@ -55,73 +158,27 @@ class ResponsiveDeckCardWidget(QFrame):
         # Deck name
         self.name_label = QLabel(self.deck_name)
         self.name_label.setAlignment(Qt.AlignCenter)
-        self.name_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.name_label.setObjectName("name")
         self.name_label.setWordWrap(True)
         text_layout.addWidget(self.name_label)
         
         # Card count info
         self.count_label = QLabel(f"{self.card_count} cards")
         self.count_label.setAlignment(Qt.AlignCenter)
-        self.count_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.7);
-                font-size: 12px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.count_label.setObjectName("count")
         text_layout.addWidget(self.count_label)
         
         # Due count (if any)
         if self.due_count > 0:
             self.due_label = QLabel(f"{self.due_count} due")
             self.due_label.setAlignment(Qt.AlignCenter)
-            self.due_label.setStyleSheet("""
-                QLabel {
-                    color: #ff6b6b;
-                    font-size: 11px;
-                    font-weight: bold;
-                    background: transparent;
-                    font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-                }
-            """)
+            self.due_label.setObjectName("due")
             text_layout.addWidget(self.due_label)
         else:
             self.due_label = None
             
         layout.addWidget(self.text_container)
         
-        # Centered sword for selection state (initially hidden)
-        self.centered_sword = QLabel()
-        self.centered_sword.setAlignment(Qt.AlignCenter)
-        self.centered_sword.setFixedSize(200, 120)
-        self.centered_sword.setStyleSheet("QLabel { background: transparent; border: none; }")
-        # Load SVG sword image for centered display
-        sword_center_path = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
-        if sword_center_path:
-            from PySide6.QtGui import QPixmap
-            _pix = QPixmap(sword_center_path)
-            if not _pix.isNull():
-                scaled = _pix.scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.centered_sword.setPixmap(scaled)
-            else:
-                self.centered_sword.setText("⚔️")
-        else:
-            self.centered_sword.setText("⚔️")
-        self.centered_sword.hide()
-        
-        # Position centered sword to overlay the entire card
-        self.centered_sword.move(0, 0)
-        self.centered_sword.setParent(self)
-        
         layout.addStretch()
         
         # Preview button (tomato icon) - centered at bottom
@@ -129,39 +186,15 @@ class ResponsiveDeckCardWidget(QFrame):
         self.preview_btn.setFixedSize(28, 28)
         
         # Try to use tomato SVG icon
-        tomato_path = asset_path("data", "images", "svg", "tomato-svgrepo-com.svg")
-        if tomato_path:
-            icon = QIcon(tomato_path)
-            if not icon.isNull():
-                self.preview_btn.setIcon(icon)
-                self.preview_btn.setText("")
-            else:
-                self.preview_btn.setText("🍅")
+        icon = cached_icon(_TOMATO_SVG) if _TOMATO_SVG else None
+        if icon is not None and not icon.isNull():
+            self.preview_btn.setIcon(icon)
         else:
             self.preview_btn.setText("🍅")
         
-        self.preview_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                color: #ff6347;
-                border: 2px solid transparent;
-                border-radius: 14px;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 2px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 99, 71, 0.2);
-                border: 2px solid rgba(255, 99, 71, 0.6);
-                color: #ff4500;
-            }
-            QPushButton:pressed {
-                background: rgba(255, 99, 71, 0.4);
-                border: 2px solid rgba(255, 99, 71, 0.8);
-            }
-        """)
+        self.preview_btn.setObjectName("preview")
         
-        self.preview_btn.clicked.connect(lambda: self.preview_requested.emit(self.deck_id))
+        self.preview_btn.clicked.connect(self._emit_preview)
         
         # Center the preview button at bottom
         button_layout = QHBoxLayout()
@@ -169,71 +202,61 @@ class ResponsiveDeckCardWidget(QFrame):
         button_layout.addWidget(self.preview_btn)
         button_layout.addStretch()
         layout.addLayout(button_layout)
+        self._stack.addWidget(info_page)
+        
+        # The selection sword page and the hover sword are built on first use,
+        # see _ensure_centered_sword and _ensure_sword_label
+        self.centered_sword = None
+        self.sword_label = None
+        
+    def _ensure_centered_sword(self):
+        """Create the centered selection sword page the first time it is needed"""
+        if self.centered_sword is not None:
+            return self.centered_sword
+        self.centered_sword = QLabel()
+        self.centered_sword.setAlignment(Qt.AlignCenter)
+        # Load SVG sword image for centered display
+        pix = cached_pixmap(_SWORD_SVG, 64, 64)
+        if pix is not None:
+            self.centered_sword.setPixmap(pix)
+        else:
+            self.centered_sword.setText("⚔️")
+        self._stack.addWidget(self.centered_sword)
+        return self.centered_sword
         
-        # Sword overlay (initially hidden) - transparent background, no border
-        self.sword_label = QLabel()
+    def _ensure_sword_label(self):
+        """Create the top-right hover sword the first time it is needed"""
+        if self.sword_label is not None:
+            return self.sword_label
+        # Sword overlay - transparent background, no border
+        self.sword_label = QLabel(self)
         self.sword_label.setFixedSize(24, 24)
-        self.sword_label.hide()
 
         # Try to use sword SVG icon
-        sword_path = asset_path("data", "images", "svg", "sword-svgrepo-com.svg")
-        if sword_path:
-            from PySide6.QtGui import QPixmap
-            pixmap = QPixmap(sword_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(20, 20, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                self.sword_label.setPixmap(scaled_pixmap)
-            else:
-                self.sword_label.setText("⚔️")
+        pixmap = cached_pixmap(_SWORD_SVG, 20, 20)
+        if pixmap is not None:
+            self.sword_label.setPixmap(pixmap)
         else:
             self.sword_label.setText("⚔️")
 
-        self.sword_label.setStyleSheet("QLabel { background: transparent; border: none; }")
-        try:
-            self.sword_label.setAttribute(Qt.WA_TranslucentBackground, True)
-        except Exception:
-            pass
+        self.sword_label.setAttribute(Qt.WA_TranslucentBackground, True)
         self.sword_label.setContentsMargins(0, 0, 0, 0)
 
         # Position sword in top-right corner
         self.sword_label.move(170, 10)
-        self.sword_label.setParent(self)
+        return self.sword_label
+        
+    @Slot()
+    def _emit_preview(self):
+        """Ask for a preview of this card's deck"""
+        self.preview_requested.emit(self.deck_id)
         
     def _update_style(self):
         """Update styling based on selection state"""
-        if self.is_selected:
-            style = """
-                ResponsiveDeckCardWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(20, 20, 25, 0.95),
-                        stop:1 rgba(10, 10, 15, 0.95));
-                    border-radius: 12px;
-                    border: none;
-                }
-                ResponsiveDeckCardWidget QLabel { border: none; background: transparent; }
-                ResponsiveDeckCardWidget:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(30, 30, 35, 0.95),
-                        stop:1 rgba(15, 15, 20, 0.95));
-                }
-            """
-        else:
-            style = """
-                ResponsiveDeckCardWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(60, 60, 60, 0.9),
-                        stop:1 rgba(40, 40, 40, 0.9));
-                    border-radius: 12px;
-                    border: none;
-                }
-                ResponsiveDeckCardWidget QLabel { border: none; background: transparent; }
-                ResponsiveDeckCardWidget:hover {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 rgba(45, 45, 50, 0.95),
-                        stop:1 rgba(25, 25, 30, 0.95));
-                }
-            """
-        self.setStyleSheet(style)
+        self.setProperty("selected", "true" if self.is_selected else "false")
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.update()
     
     def toggle_selection(self):
         """Toggle the selection state of this deck card"""
@@ -250,16 +273,14 @@ class ResponsiveDeckCardWidget(QFrame):
     
     def _update_selection_display(self):
         """Update the visual display based on selection state"""
+        # Deck info when unselected, centered sword when selected
         if self.is_selected:
-            # Hide text content and show centered sword
-            self.text_container.hide()
-            self.preview_btn.hide()
-            self.centered_sword.show()
+            self._stack.setCurrentWidget(self._ensure_centered_sword())
         else:
-            # Show text content and hide centered sword
-            self.text_container.show()
-            self.preview_btn.show()
-            self.centered_sword.hide()
+            self._stack.setCurrentIndex(0)
+        # Switching pages raises the new page; keep the hover sword on top
+        if self.sword_label:
+            self.sword_label.raise_()
     
     def _create_hover_effect(self):
         """Create a visual hover effect with jump animation (no shadow)"""
@@ -269,70 +290,53 @@ class ResponsiveDeckCardWidget(QFrame):
     def _remove_hover_effect(self):
         """Remove the hover effect and stop animation"""
         # Stop any running jump animation
-        if self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running:
+        if self._jump_animation.state() == QPropertyAnimation.Running:
             self._jump_animation.stop()
     
     def _start_jump_animation(self):
         """Start the jump animation"""
-        if self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running:
+        if self._jump_animation.state() == QPropertyAnimation.Running:
             return  # Animation already running
         
         # Store original position if not already stored
         if self._original_pos is None:
             self._original_pos = self.pos()
         
-        # Create jump animation
-        self._jump_animation = QPropertyAnimation(self, b"pos")
-        self._jump_animation.setDuration(150)  # Quick jump
-        self._jump_animation.setEasingCurve(QEasingCurve.OutCubic)
-        
-        # Jump up by 8 pixels
+        # Jump up by 8 pixels and come back
         jump_pos = QPoint(self._original_pos.x(), self._original_pos.y() - 8)
-        self._jump_animation.setStartValue(self._original_pos)
-        self._jump_animation.setEndValue(jump_pos)
-        
-        # Connect finished signal to return to original position
-        self._jump_animation.finished.connect(self._on_jump_finished)
+        self._jump_up.setStartValue(self._original_pos)
+        self._jump_up.setEndValue(jump_pos)
+        self._jump_down.setStartValue(jump_pos)
+        self._jump_down.setEndValue(self._original_pos)
         self._jump_animation.start()
     
-    def _on_jump_finished(self):
-        """Handle jump animation finished - return to original position"""
-        if self._jump_animation:
-            # Create return animation
-            return_animation = QPropertyAnimation(self, b"pos")
-            return_animation.setDuration(100)  # Quick return
-            return_animation.setEasingCurve(QEasingCurve.InCubic)
-            
-            return_animation.setStartValue(self.pos())
-            return_animation.setEndValue(self._original_pos)
-            return_animation.start()
-    
     def enterEvent(self, event):
-        """Show sword and create hover effect with jump"""
-        if self.sword_label:
-            self.sword_label.show()
-        
-        # Only create effect if not already in hover state
-        if not self._is_hovered:
-            self._is_hovered = True
-            self._create_hover_effect()
-        
+        """Schedule the hover state: sword and jump"""
+        self._pending_hover = True
+        self._hover_timer.start()
         super().enterEvent(event)
     
     def leaveEvent(self, event):
-        """Hide sword and remove hover effect"""
-        if self.sword_label:
-            self.sword_label.hide()
-        
-        # Only remove effect if currently in hover state
+        """Schedule leaving the hover state"""
+        self._pending_hover = False
+        self._hover_timer.start()
+        super().leaveEvent(event)
+    
+    def _apply_hover_state(self):
+        """Show or hide the sword and jump once the hover state has settled"""
+        if self._pending_hover == self._is_hovered:
+            return
+        self._is_hovered = self._pending_hover
         if self._is_hovered:
-            self._is_hovered = False
+            self._ensure_sword_label().show()
+            self._create_hover_effect()
+        else:
+            if self.sword_label:
+                self.sword_label.hide()
             self._remove_hover_effect()
             # Reset position immediately when leaving
             if self._original_pos is not None:
                 self.move(self._original_pos)
-        
-        super().leaveEvent(event)
     
     def mousePressEvent(self, event):
         """Handle mouse click to toggle deck selection"""
@@ -353,12 +357,12 @@ class ResponsiveDeckCardWidget(QFrame):
         """Override move to update original position"""
         super().move(pos)
         # Update original position if we're not currently animating
-        if not (self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running):
+        if self._jump_animation.state() != QPropertyAnimation.Running:
             self._original_pos = pos
     
     def reset_position(self):
         """Reset the widget to its original position and stop any animations"""
-        if self._jump_animation and self._jump_animation.state() == QPropertyAnimation.Running:
+        if self._jump_animation.state() == QPropertyAnimation.Running:
             self._jump_animation.stop()
         
         if self._original_pos is not None:
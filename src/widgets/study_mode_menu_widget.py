@@ -4,6 +4,7 @@ StudyModeMenuWidget - reusable study mode menu with cards
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QFrame
 from PySide6.QtCore import Qt, Signal
+from src.ui._qss import STUDY_MODES, study_mode_card_qss
 
 
 class StudyModeCard(QFrame):
@@ -21,21 +22,7 @@ class StudyModeCard(QFrame):
     def _init_ui(self):
         self.setFixedSize(280, 160)
         self.setCursor(Qt.PointingHandCursor)
-        self.setStyleSheet(f"""
-            StudyModeCard {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(60, 60, 60, 0.9),
-                    stop:1 rgba(40, 40, 40, 0.9));
-                border-radius: 16px;
-                border: 2px solid rgba(255, 255, 255, 0.1);
-            }}
-            StudyModeCard:hover {{
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 rgba(80, 80, 80, 0.9),
-                    stop:1 rgba(60, 60, 60, 0.9));
-                border: 2px solid {self.color};
-            }}
-        """)
+        self.setStyleSheet(study_mode_card_qss(self.color))
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -43,40 +30,18 @@ class StudyModeCard(QFrame):
 
         icon_label = QLabel(self.icon_text)
         icon_label.setAlignment(Qt.AlignCenter)
-        icon_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.color};
-                font-size: 48px;
-                background: transparent;
-                font-family: "Segoe UI Emoji", "Apple Color Emoji", "Noto Color Emoji";
-            }}
-        """)
+        icon_label.setObjectName("icon")
         layout.addWidget(icon_label)
 
         title_label = QLabel(self.title)
         title_label.setAlignment(Qt.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self.color};
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }}
-        """)
+        title_label.setObjectName("title")
         layout.addWidget(title_label)
 
         desc_label = QLabel(self.description)
         desc_label.setAlignment(Qt.AlignCenter)
         desc_label.setWordWrap(True)
-        desc_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.8);
-                font-size: 12px;
-                background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        desc_label.setObjectName("description")
         layout.addWidget(desc_label)
 
     def mousePressEvent(self, event):
@@ -110,7 +75,6 @@ class StudyModeMenuWidget(QWidget):
                 font-size: 22px;
                 font-weight: bold;
                 background: transparent;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
                 margin: 10px 0px;
             }
         """)
@@ -120,16 +84,7 @@ class StudyModeMenuWidget(QWidget):
         grid.setSpacing(20)
         grid.setAlignment(Qt.AlignCenter)
 
-        study_modes = [
-            ("review", "Review", "Study with spaced repetition algorithm", "🧠", "#64c8ff"),
-            ("test", "Test Mode", "Quiz yourself without revealing answers", "✏️", "#ff6b6b"),
-            ("browse", "Browse Cards", "Go through cards at your own pace", "📖", "#66bb6a"),
-            ("cram", "Cram Session", "Quick review of all cards", "⚡", "#ffa726"),
-            ("new_only", "New Cards", "Study only new, unseen cards", "✨", "#ab47bc"),
-            ("difficult", "Difficult Cards", "Focus on cards you find challenging", "🎯", "#f44336"),
-        ]
-
-        for i, (mode, title_text, desc, icon, color) in enumerate(study_modes):
+        for i, (mode, title_text, desc, icon, color) in enumerate(STUDY_MODES):
             card = StudyModeCard(mode, title_text, desc, icon, color)
             card.mode_selected.connect(self.mode_selected.emit)
             row, col = divmod(i, 3)
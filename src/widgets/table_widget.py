@@ -2,8 +2,92 @@
 Reusable table widgets
 """
 
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem
-from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+
+# One stylesheet for the table and its title label
+_REVIEW_TABLE_QSS = """
+    ReviewTableWidget {
+        background: transparent;
+        color: white;
+    }
+    QTableView {
+        background-color: #2d2d2d;
+        border: 2px solid #444;
+        border-radius: 8px;
+        gridline-color: #555;
+        color: white;
+        font-size: 14px;
+    }
+    QHeaderView::section {
+        background-color: #383838;
+        color: white;
+        padding: 6px 10px;
+        border: none;
+    }
+    QTableView::item { padding: 8px; }
+    ReviewTableWidget QLabel#title {
+        color: white;
+        font-size: 18px;
+        font-weight: bold;
+        background: transparent;
+        margin: 6px 0px;
+    }
+"""
+
+
+class CardTableModel(QAbstractTableModel):
+    """Read-only Question/Answer model over a list of card dicts, no per-cell items"""
+
+    _HEADERS = ("Question", "Answer")
+    _KEYS = ("front", "back")
+    # Rows are handed to the view in batches as it scrolls near the end
+    _FETCH_BATCH = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cards = []
+        self._loaded_rows = 0
+
+    def set_cards(self, cards):
+        """Replace the cards shown by the model"""
+        self.beginResetModel()
+        self._cards = cards or []
+        self._loaded_rows = min(self._FETCH_BATCH, len(self._cards))
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded_rows
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded_rows < len(self._cards)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self._FETCH_BATCH, len(self._cards) - self._loaded_rows)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded_rows, self._loaded_rows + count - 1)
+        self._loaded_rows += count
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._cards[index.row()].get(self._KEYS[index.column()], '')
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
 
 
 class ReviewTableWidget(QWidget):
@@ -14,28 +98,7 @@ class ReviewTableWidget(QWidget):
         self._init_ui()
 
     def _init_ui(self):
-        self.setStyleSheet("""
-            ReviewTableWidget {
-                background: transparent;
-                color: white;
-            }
-            QTableWidget {
-                background-color: #2d2d2d;
-                border: 2px solid #444;
-                border-radius: 8px;
-                gridline-color: #555;
-                color: white;
-                font-size: 14px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-            QHeaderView::section {
-                background-color: #383838;
-                color: white;
-                padding: 6px 10px;
-                border: none;
-            }
-            QTableWidget::item { padding: 8px; }
-        """)
+        self.setStyleSheet(_REVIEW_TABLE_QSS)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(20, 0, 20, 0)
@@ -43,20 +106,12 @@ class ReviewTableWidget(QWidget):
 
         title = QLabel("Review Cards")
         title.setAlignment(Qt.AlignLeft)
-        title.setStyleSheet("""
-            QLabel {
-                color: white;
-                font-size: 18px;
-                font-weight: bold;
-                background: transparent;
-                margin: 6px 0px;
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        title.setObjectName("title")
         layout.addWidget(title)
 
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Question", "Answer"])
+        self.model = CardTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setDefaultSectionSize(400)
         self.table.verticalHeader().setVisible(False)
@@ -66,16 +121,4 @@ class ReviewTableWidget(QWidget):
 
     def set_cards(self, cards):
         """Populate table with list of dicts containing 'front' and 'back'."""
-        self.table.setRowCount(0)
-        if not cards:
-            return
-        self.table.setRowCount(len(cards))
-        for row, card in enumerate(cards):
-            q_item = QTableWidgetItem(card.get('front', ''))
-            a_item = QTableWidgetItem(card.get('back', ''))
-            q_item.setFlags(q_item.flags() ^ Qt.ItemIsEditable)
-            a_item.setFlags(a_item.flags() ^ Qt.ItemIsEditable)
-            self.table.setItem(row, 0, q_item)
-            self.table.setItem(row, 1, a_item)
-
-
+        self.model.set_cards(cards)
@@ -3,7 +3,8 @@ Vertical Menu Widget - Main menu cards (Study, Decks, Timer)
 """
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtGui import QPainter
 from .menu_card_widget import MenuCardWidget
 from ..ui.menu_config import MenuCardConfig
 
@@ -19,6 +20,16 @@ class VerticalMenuWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.menu_card_config = MenuCardConfig()
+        # A resize drag re-lays the cards out at most every 33ms, once the size settles
+        self._layout_applied = False
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(33)
+        self._resize_timer.timeout.connect(self._apply_responsive_layout)
+        # Last applied values; unchanged ones are not set again
+        self._card_width = None
+        self._layout_spacing = None
+        self._top_margin = None
         self.init_ui()
         
     def init_ui(self):
@@ -87,9 +98,26 @@ class VerticalMenuWidget(QWidget):
         self.timer_card.setFixedWidth(self.menu_card_config.width)
         layout.addWidget(self.timer_card, alignment=Qt.AlignHCenter)
         
+    def paintEvent(self, event):
+        """Paint the card drop shadows beneath the cards"""
+        painter = QPainter(self)
+        for card in (self.study_card, self.decks_card, self.timer_card):
+            if card.isVisible():
+                card.paint_shadow(painter)
+        painter.end()
+        
     def resizeEvent(self, event):
         """Handle responsive layout changes with dynamic spacing"""
         super().resizeEvent(event)
+        # The first layout is applied right away so the initial paint is already right
+        if self._layout_applied:
+            self._resize_timer.start()
+        else:
+            self._apply_responsive_layout()
+        
+    def _apply_responsive_layout(self):
+        """Size the cards and spacing for the current widget size"""
+        self._layout_applied = True
         
         # Get current dimensions
         current_width = self.width()
@@ -99,8 +127,10 @@ class VerticalMenuWidget(QWidget):
         available_width = max(400, min(current_width - 100, self.menu_card_config.width))
         
         # Resize main cards to available width
-        for card in [self.study_card, self.decks_card, self.timer_card]:
-            card.setFixedWidth(available_width)
+        if available_width != self._card_width:
+            for card in [self.study_card, self.decks_card, self.timer_card]:
+                card.setFixedWidth(available_width)
+            self._card_width = available_width
         
         # SMART RESPONSIVE SPACING: Ensure all buttons are visible while maintaining good spacing
         layout = self.layout()
@@ -126,6 +156,10 @@ class VerticalMenuWidget(QWidget):
                 top_margin = 20
             
             # Apply calculated spacing
-            layout.setSpacing(vertical_spacing)
-            mleft, _, mright, mbottom = layout.contentsMargins().left(), 0, layout.contentsMargins().right(), layout.contentsMargins().bottom()
-            layout.setContentsMargins(mleft, top_margin, mright, mbottom)
+            if vertical_spacing != self._layout_spacing:
+                layout.setSpacing(vertical_spacing)
+                self._layout_spacing = vertical_spacing
+            if top_margin != self._top_margin:
+                mleft, _, mright, mbottom = layout.contentsMargins().left(), 0, layout.contentsMargins().right(), layout.contentsMargins().bottom()
+                layout.setContentsMargins(mleft, top_margin, mright, mbottom)
+                self._top_margin = top_margin
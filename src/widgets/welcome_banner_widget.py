@@ -2,15 +2,208 @@
 Welcome Banner Widget - Main banner component for the application
 """
 
-from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGraphicsDropShadowEffect, QSizePolicy
-from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QTimer, QSequentialAnimationGroup, QParallelAnimationGroup, QPointF, QEasingCurve
-from PySide6.QtGui import QFont, QLinearGradient, QColor, QPalette, QPainter, QPen, QBrush, QRadialGradient, QConicalGradient
+from PySide6.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QGraphicsDropShadowEffect, QSizePolicy, QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect
+from PySide6.QtCore import Qt, QAbstractAnimation, QPropertyAnimation, QVariantAnimation, QEasingCurve, QRect, QRectF, QPoint, QPointF, QSize, QTimer, QElapsedTimer
+from PySide6.QtGui import QFont, QPixmap, QGradient, QLinearGradient, QColor, QPainter, QPen
 import math
-import random
 
 from src.animation.sword_tomato_anim import SwordTomatoAnim
 
 
+# The banner has one fixed size, which is also its size hint
+_BANNER_SIZE = QSize(720, 180)
+
+# Banner background: a diagonal gradient across the whole banner
+_BANNER_GRADIENT_STOPS = (
+    (0.0, QColor(37, 99, 235, 242)),
+    (0.2, QColor(59, 130, 246, 230)),
+    (0.4, QColor(5, 150, 105, 224)),
+    (0.6, QColor(16, 185, 129, 217)),
+    (0.8, QColor(217, 119, 6, 209)),
+    (1.0, QColor(37, 99, 235, 191)),
+)
+_BANNER_BORDER_WIDTH = 3
+_BANNER_QSS = """
+    WelcomeBannerWidget QLabel#bannerTitle {
+        color: white;
+        background: transparent;
+        border: none;
+        outline: none;
+        padding: 0px;
+        margin: 0px;
+        font-weight: 700;
+        font-size: 46px;  /* Explicit size to override global QLabel */
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+    WelcomeBannerWidget QLabel#bannerSubtitle {
+        color: rgba(255, 255, 255, 0.95);
+        background: transparent;
+        border: none;
+        outline: none;
+        padding: 0px;
+        margin: 0px;
+        font-weight: 500;
+        font-size: 22px;  /* Explicit size to override global QLabel */
+        font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
+    }
+"""
+
+# The looping animations share one driver timer ticking at the fastest loop's interval
+_LOOP_TICK_MS = 50
+
+# The pulse animations step through one sine period in 256 steps instead of calling math.sin
+_SIN_STEPS = 256
+_SIN = tuple(math.sin(2 * math.pi * i / _SIN_STEPS) for i in range(_SIN_STEPS))
+_COS_OFFSET = _SIN_STEPS // 4
+
+# Rainbow border colors, one per hue
+_HUE_COLORS = tuple(QColor.fromHsv(hue, 255, 255) for hue in range(360))
+_RAINBOW_HUE_STEP = 18
+
+# Progress dots: (color, diameter) for the dim, previous and current states, sized like the ● glyphs they replace
+_DOT_DIM, _DOT_PREVIOUS, _DOT_CURRENT = range(3)
+_DOT_STYLES = (
+    (QColor(255, 255, 255, 77), 15),
+    (QColor(255, 255, 255, 179), 16),
+    (QColor(255, 255, 255), 18),
+)
+_DOT_SIZE = 20  # Room for the largest dot
+_DOT_PITCH = 28  # Dim glyph width plus the old 12px layout spacing
+
+# Text glows are blurred once per radius and faded in and out with painter opacity
+_GLOW_LEVELS = 8
+# This fraction of a drop shadow's blur radius gives QGraphicsBlurEffect the same falloff
+_GLOW_BLUR_SCALE = 0.4
+
+
+def _glow_level(pulse):
+    """Snap a pulse in [-1, 1] to one of the cached glow levels"""
+    steps = _GLOW_LEVELS - 1
+    return round((pulse + 1) * steps / 2) * 2 / steps - 1
+
+
+# Every step's animation values, computed once so a tick is a single table lookup
+# Glow: title blur and alpha, subtitle blur and alpha
+_GLOW_FRAMES = tuple(
+    (15 + 10 * _glow_level(pulse), int(100 + 50 * pulse),
+     8 + 5 * _glow_level(pulse), int(100 + 50 * pulse) // 2)
+    for pulse in _SIN)
+# Shadow: blur, y offset and color; two periods so the opacity pulse, 1.5x faster, also wraps cleanly
+_SHADOW_COLORS = {alpha: QColor(0, 0, 0, alpha) for alpha in range(80, 121)}
+_SHADOW_FRAMES = tuple(
+    (int(25 + 10 * _SIN[step % _SIN_STEPS]),
+     int(8 + 3 * _SIN[(step + _COS_OFFSET) % _SIN_STEPS]),
+     _SHADOW_COLORS[int(100 + 20 * _SIN[(step * 3 // 2) % _SIN_STEPS])])
+    for step in range(2 * _SIN_STEPS))
+_BORDER_RADII = tuple(int(22 + 3 * pulse) for pulse in _SIN)
+
+
+def _glow_pixmap(label, blur_radius, margin):
+    """Blur a white copy of the label's text, with margin room for the glow to spread"""
+    dpr = label.devicePixelRatioF()
+    rect = label.contentsRect()
+    source = QPixmap(label.size() * dpr)
+    source.setDevicePixelRatio(dpr)
+    source.fill(Qt.transparent)
+    painter = QPainter(source)
+    painter.setFont(label.font())
+    painter.setPen(Qt.white)
+    painter.drawText(rect, label.alignment(), label.text())
+    painter.end()
+
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur_radius * _GLOW_BLUR_SCALE)
+    item = QGraphicsPixmapItem(source)
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+
+    width = label.width() + 2 * margin
+    height = label.height() + 2 * margin
+    glow = QPixmap(round(width * dpr), round(height * dpr))
+    glow.setDevicePixelRatio(dpr)
+    glow.fill(Qt.transparent)
+    painter = QPainter(glow)
+    scene.render(painter, QRectF(0, 0, width, height), QRectF(-margin, -margin, width, height))
+    painter.end()
+    return glow
+
+
+class _TextGlow:
+    """White glow painted behind a label's text, like a zero-offset drop shadow
+
+    A QGraphicsDropShadowEffect re-blurs the label every time its radius or
+    color changes; these frames are blurred once per text and radius.
+    """
+
+    def __init__(self, label, blur_radius, alpha):
+        self.label = label
+        self.blur_radius = blur_radius
+        self.alpha = alpha
+        self._source = None
+        self._frames = {}
+
+    def set_glow(self, blur_radius, alpha):
+        self.blur_radius = blur_radius
+        self.alpha = alpha
+
+    def paint(self, painter):
+        label = self.label
+        if not label.text() or not label.isVisible():
+            return
+        source = (label.text(), label.size())
+        if source != self._source:
+            self._source = source
+            self._frames = {}
+        margin = math.ceil(self.blur_radius)
+        frame = self._frames.get(self.blur_radius)
+        if frame is None:
+            frame = self._frames[self.blur_radius] = _glow_pixmap(label, self.blur_radius, margin)
+        painter.setOpacity(self.alpha / 255)
+        painter.drawPixmap(label.pos() - QPoint(margin, margin), frame)
+        painter.setOpacity(1)
+
+
+class _ProgressDots(QWidget):
+    """Row of progress dots painted in one pass, the current and previous dot highlighted"""
+
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self.count = count
+        self.current = None  # All dots stay dim until the first pulse
+        self.setFixedSize((count - 1) * _DOT_PITCH + _DOT_SIZE, _DOT_SIZE)
+
+    def set_current(self, index):
+        self.current = index
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        center_y = self.height() / 2
+        for i in range(self.count):
+            if self.current is None:
+                state = _DOT_DIM
+            elif i == self.current:
+                state = _DOT_CURRENT
+            elif i == (self.current - 1) % self.count:
+                state = _DOT_PREVIOUS
+            else:
+                state = _DOT_DIM
+            color, diameter = _DOT_STYLES[state]
+            painter.setBrush(color)
+            center_x = i * _DOT_PITCH + _DOT_SIZE / 2
+            painter.drawEllipse(QPointF(center_x, center_y), diameter / 2, diameter / 2)
+        painter.end()
+
+
+def _reserve_text_width(label, text):
+    """Reserve the width of the label's final text, so typing it in keeps the layout width"""
+    label.ensurePolished()
+    label.setMinimumWidth(label.fontMetrics().horizontalAdvance(text))
+
+
 class WelcomeBannerWidget(QWidget):
     """Enhanced game-like welcome banner with multiple animations and styling"""
     
@@ -18,32 +211,30 @@ class WelcomeBannerWidget(QWidget):
         super().__init__(parent)
         self.title_text = title
         self.subtitle_text = subtitle
+        # Every typewriter frame, built once and indexed by the number of characters shown
+        self.title_frames = tuple(title[:i] for i in range(len(title) + 1))
+        self.subtitle_frames = tuple(subtitle[:i] for i in range(len(subtitle) + 1))
         self.init_ui()
         self.setup_animations()
 
     def init_ui(self):
         """Initialize the banner UI with game-like styling"""
-        self.setFixedHeight(180)  # Compact height
-        self.setFixedWidth(720)
+        self.setFixedSize(_BANNER_SIZE)  # Compact 720x180 banner
         
         # Set size policy to ensure centering
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
         
-        # Enhanced game-like banner styling with animated gradient
-        self.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(37, 99, 235, 0.95),
-                    stop:0.2 rgba(59, 130, 246, 0.9),
-                    stop:0.4 rgba(5, 150, 105, 0.88),
-                    stop:0.6 rgba(16, 185, 129, 0.85),
-                    stop:0.8 rgba(217, 119, 6, 0.82),
-                    stop:1 rgba(37, 99, 235, 0.75));
-                border-radius: 25px;
-                border: 3px solid rgba(255, 255, 255, 0.3);
-                outline: none;
-            }
-        """)
+        # Enhanced game-like banner styling with animated gradient. The background and
+        # border are painted in paintEvent; the animations only update these fields.
+        self._bg_gradient = QLinearGradient(0, 0, 1, 1)
+        self._bg_gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+        for position, color in _BANNER_GRADIENT_STOPS:
+            self._bg_gradient.setColorAt(position, color)
+        self._border_color = QColor(255, 255, 255, 76)
+        self._border_radius = 25
+        
+        # The labels are styled by the banner's one stylesheet, found by object name
+        self.setStyleSheet(_BANNER_QSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 15, 40, 10)  # Compact margins
@@ -58,28 +249,13 @@ class WelcomeBannerWidget(QWidget):
         title_font.setFamily("Cascadia Code")
         self.title_label.setFont(title_font)
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: white;
-                background: transparent;
-                border: none;
-                outline: none;
-                padding: 0px;
-                margin: 0px;
-                font-weight: 700;
-                font-size: 46px;  /* Explicit size to override global QLabel */
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.title_label.setObjectName("bannerTitle")
         
         # Add animated glow effect to title
-        title_glow = QGraphicsDropShadowEffect()
-        title_glow.setBlurRadius(20)
-        title_glow.setColor(QColor(255, 255, 255, 150))
-        title_glow.setOffset(0, 0)
-        self.title_label.setGraphicsEffect(title_glow)
+        self.title_glow = _TextGlow(self.title_label, 20, 150)
         
         layout.addWidget(self.title_label)
+        _reserve_text_width(self.title_label, self.title_text)
         
         # Enhanced subtitle with animated effects
         self.subtitle_label = QLabel("")  # Start empty for typewriter effect
@@ -89,65 +265,27 @@ class WelcomeBannerWidget(QWidget):
         subtitle_font.setFamily("Cascadia Code")
         self.subtitle_label.setFont(subtitle_font)
         self.subtitle_label.setAlignment(Qt.AlignCenter)
-        self.subtitle_label.setStyleSheet("""
-            QLabel {
-                color: rgba(255, 255, 255, 0.95);
-                background: transparent;
-                border: none;
-                outline: none;
-                padding: 0px;
-                margin: 0px;
-                font-weight: 500;
-                font-size: 22px;  /* Explicit size to override global QLabel */
-                font-family: "Cascadia Code", "Cascadia Mono", "Fira Code", "Consolas", "Courier New", monospace;
-            }
-        """)
+        self.subtitle_label.setObjectName("bannerSubtitle")
         
         # Add subtle glow to subtitle
-        subtitle_glow = QGraphicsDropShadowEffect()
-        subtitle_glow.setBlurRadius(10)
-        subtitle_glow.setColor(QColor(255, 255, 255, 80))
-        subtitle_glow.setOffset(0, 0)
-        self.subtitle_label.setGraphicsEffect(subtitle_glow)
+        self.subtitle_glow = _TextGlow(self.subtitle_label, 10, 80)
         
         layout.addWidget(self.subtitle_label)
+        _reserve_text_width(self.subtitle_label, self.subtitle_text)
 
         # Sword -> Tomato animation centered under subtitle
         anim_row = QHBoxLayout()
         anim_row.setAlignment(Qt.AlignCenter)
         self.sword_tomato = SwordTomatoAnim(size=36)  # Larger animation
-        self.sword_tomato.setStyleSheet("background: transparent; border: none; outline: none;")
         anim_row.addWidget(self.sword_tomato)
         layout.addLayout(anim_row)
         
         # Enhanced progress indicator dots with animations
-        dots_layout = QHBoxLayout()
-        dots_layout.setAlignment(Qt.AlignCenter)
-        dots_layout.setSpacing(12)
-        
-        self.dots = []
-        for i in range(5):  # Progress dots
-            dot = QLabel("●")
-            dot.setStyleSheet("""
-                QLabel {
-                    color: rgba(255, 255, 255, 0.3);
-                    font-size: 18px;
-                    background: transparent;
-                    border: none;
-                    outline: none;
-                    padding: 0px;
-                    margin: 0px;
-                }
-            """)
-            self.dots.append(dot)
-            dots_layout.addWidget(dot)
-            
-        layout.addLayout(dots_layout)
+        self.dots = _ProgressDots(5)
+        layout.addWidget(self.dots, alignment=Qt.AlignHCenter)
         
         # Add animated border elements
-        self.border_timer = QTimer()
-        self.border_timer.timeout.connect(self.animate_border)
-        self.border_phase = 0
+        self.border_step = 0
         
         # Enhanced shadow effect with animation
         self.shadow_effect = QGraphicsDropShadowEffect(self)
@@ -157,71 +295,72 @@ class WelcomeBannerWidget(QWidget):
         self.setGraphicsEffect(self.shadow_effect)
         
         # Add rainbow border effect
-        self.rainbow_timer = QTimer()
-        self.rainbow_timer.timeout.connect(self.animate_rainbow_border)
-        self.rainbow_phase = 0
+        self.rainbow_hue = 0
 
     def setup_animations(self):
         """Setup multiple coordinated animations"""
         # Slide in animation with bounce
-        self.slide_anim = QPropertyAnimation(self, b"geometry")
+        self.slide_anim = QPropertyAnimation(self, b"pos")
         self.slide_anim.setDuration(1000)
         self.slide_anim.setEasingCurve(QEasingCurve.OutBounce)
         
-        # Scale animation for dramatic entrance
-        self.scale_anim = QPropertyAnimation(self, b"geometry")
-        self.scale_anim.setDuration(1200)
-        self.scale_anim.setEasingCurve(QEasingCurve.OutElastic)
+        # Title and subtitle typewriter effects: the character count runs 0..N, 100ms and 80ms per character
+        self.title_typewriter = self.create_typewriter(self.title_frames, 100, self.show_title_frame)
+        self.subtitle_typewriter = self.create_typewriter(self.subtitle_frames, 80, self.show_subtitle_frame)
         
-        # Title typewriter effect
-        self.title_timer = QTimer()
-        self.title_timer.timeout.connect(self.typewriter_title)
-        self.title_index = 0
-        
-        # Subtitle typewriter effect
-        self.subtitle_timer = QTimer()
-        self.subtitle_timer.timeout.connect(self.typewriter_subtitle)
-        self.subtitle_index = 0
-        
-        # Dot pulse animation timer
-        self.dot_timer = QTimer()
-        self.dot_timer.timeout.connect(self.animate_dots)
+        # Dot pulse, glow, shadow and border animations
         self.current_dot = 0
-        
-        # Glow pulse animation
-        self.glow_timer = QTimer()
-        self.glow_timer.timeout.connect(self.animate_glow)
-        self.glow_phase = 0
-        
-        # Shadow pulse animation
-        self.shadow_timer = QTimer()
-        self.shadow_timer.timeout.connect(self.animate_shadow)
-        self.shadow_phase = 0
+        self.glow_step = 0
+        self.shadow_step = 0
+        
+        # One timer drives every looping animation, each at its own interval (ms)
+        self.loop_timer = QTimer(self)
+        self.loop_timer.timeout.connect(self.tick_loops)
+        self.loop_clock = QElapsedTimer()
+        self.loops = (
+            (self.animate_rainbow_border, 50),
+            (self.animate_glow, 100),
+            (self.animate_shadow, 150),
+            (self.animate_border, 200),
+            (self.animate_dots, 500),
+        )
+        self.loop_due = []
+        
+        # How to restart the timers and animations paused while the banner is hidden
+        self.paused = []
+
+    def create_typewriter(self, frames, char_ms, show_frame):
+        """Animate the number of characters shown, calling show_frame as it changes"""
+        typewriter = QVariantAnimation(self)
+        typewriter.setStartValue(0)
+        typewriter.setEndValue(len(frames) - 1)
+        typewriter.setDuration((len(frames) - 1) * char_ms)
+        typewriter.valueChanged.connect(show_frame)
+        return typewriter
 
     def play(self):
         """Start the welcome banner animations"""
-        # Ensure proper geometry setup before animation
-        self.setFixedSize(720, 180)
-        self.updateGeometry()
+        # The banner's size is fixed in init_ui; only its position animates
         
         # Get parent widget dimensions for proper centering
         if self.parent():
             parent_width = self.parent().width()
-            x_center = max(0, (parent_width - 720) // 2)
+            x_center = max(0, (parent_width - _BANNER_SIZE.width()) // 2)
         else:
             x_center = 0
         
         # Get initial geometry with proper centering
-        w = 720
-        h = 180
+        w = _BANNER_SIZE.width()
+        h = _BANNER_SIZE.height()
         
         # Start from above the screen with proper horizontal centering
         start_rect = QRect(x_center, -h - 20, w, h)
         end_rect = QRect(x_center, 0, w, h)
         
+        # The size never changes, so the slide only moves the banner
         self.setGeometry(start_rect)
-        self.slide_anim.setStartValue(start_rect)
-        self.slide_anim.setEndValue(end_rect)
+        self.slide_anim.setStartValue(start_rect.topLeft())
+        self.slide_anim.setEndValue(end_rect.topLeft())
         
         # Start slide animation
         self.slide_anim.start()
@@ -231,197 +370,163 @@ class WelcomeBannerWidget(QWidget):
         QTimer.singleShot(1200, self.start_subtitle_typewriter)
         
         # Start other animations after slide completes
-        QTimer.singleShot(1100, self.start_dot_animation)
-        QTimer.singleShot(1100, self.sword_tomato.play)
-        QTimer.singleShot(1100, self.start_glow_animation)
-        QTimer.singleShot(1100, self.start_shadow_animation)
-        QTimer.singleShot(1100, self.start_rainbow_animation)
-        QTimer.singleShot(1100, self.start_border_animation)
+        QTimer.singleShot(1100, self.start_post_slide_animations)
+
+    def start_post_slide_animations(self):
+        """Start the sword animation and the looping animations once the slide is done"""
+        self.sword_tomato.play()
+        self.start_loop_animations()
 
     def start_title_typewriter(self):
         """Start typewriter effect for title"""
-        self.title_index = 0
-        self.title_timer.start(100)  # 100ms per character
+        self.start_animation(self.title_typewriter)
         
-    def typewriter_title(self):
+    def show_title_frame(self, length):
         """Typewriter effect for title"""
-        if self.title_index < len(self.title_text):
-            self.title_label.setText(self.title_text[:self.title_index + 1])
-            self.title_index += 1
-        else:
-            self.title_timer.stop()
+        self.title_label.setText(self.title_frames[length])
+        self.update()  # The glow follows the text
             
     def start_subtitle_typewriter(self):
         """Start typewriter effect for subtitle"""
-        self.subtitle_index = 0
-        self.subtitle_timer.start(80)  # 80ms per character
+        self.start_animation(self.subtitle_typewriter)
         
-    def typewriter_subtitle(self):
+    def show_subtitle_frame(self, length):
         """Typewriter effect for subtitle"""
-        if self.subtitle_index < len(self.subtitle_text):
-            self.subtitle_label.setText(self.subtitle_text[:self.subtitle_index + 1])
-            self.subtitle_index += 1
-        else:
-            self.subtitle_timer.stop()
+        self.subtitle_label.setText(self.subtitle_frames[length])
+        self.update()  # The glow follows the text
             
-    def start_dot_animation(self):
-        """Start the pulsing dot animation"""
-        self.dot_timer.start(500)  # Pulse every 500ms
+    def start_loop_animations(self):
+        """Start the dot, glow, shadow, rainbow and border loops"""
+        self.loop_clock.start()
+        self.loop_due = [interval for _, interval in self.loops]
+        self.start_timer(self.loop_timer, _LOOP_TICK_MS)
+        
+    def tick_loops(self):
+        """Run every looping animation whose interval has elapsed"""
+        # Nothing to draw while the banner is scrolled out of view or covered by siblings
+        if self.visibleRegion().isEmpty():
+            return
+        # Half a tick of slack so timer jitter does not skip a frame
+        now = self.loop_clock.elapsed() + _LOOP_TICK_MS // 2
+        for i, (animate, interval) in enumerate(self.loops):
+            due = self.loop_due[i]
+            if now >= due:
+                animate()
+                # Drop frames missed during a stall instead of replaying them
+                self.loop_due[i] = due + interval * ((now - due) // interval + 1)
 
     def animate_dots(self):
         """Animate the progress dots with enhanced effects"""
-        # Reset all dots
-        for i, dot in enumerate(self.dots):
-            if i == self.current_dot:
-                # Current dot - bright and larger
-                dot.setStyleSheet("""
-                    QLabel {
-                        color: white;
-                        font-size: 22px;
-                        background: transparent;
-                    }
-                """)
-            elif i == (self.current_dot - 1) % len(self.dots):
-                # Previous dot - medium brightness
-                dot.setStyleSheet("""
-                    QLabel {
-                        color: rgba(255, 255, 255, 0.7);
-                        font-size: 20px;
-                        background: transparent;
-                    }
-                """)
-            else:
-                # Other dots - dim
-                dot.setStyleSheet("""
-                    QLabel {
-                        color: rgba(255, 255, 255, 0.3);
-                        font-size: 18px;
-                        background: transparent;
-                    }
-                """)
-        
-        self.current_dot = (self.current_dot + 1) % len(self.dots)
-        
-    def start_glow_animation(self):
-        """Start glow pulse animation"""
-        self.glow_timer.start(100)  # 100ms updates
+        self.dots.set_current(self.current_dot)
+        self.current_dot = (self.current_dot + 1) % self.dots.count
         
     def animate_glow(self):
         """Animate glow effects"""
-        self.glow_phase += 0.1
-        intensity = int(100 + 50 * math.sin(self.glow_phase))
-        
-        # Update title glow
-        title_glow = self.title_label.graphicsEffect()
-        if title_glow:
-            title_glow.setBlurRadius(15 + 10 * math.sin(self.glow_phase))
-            title_glow.setColor(QColor(255, 255, 255, intensity))
-            
-        # Update subtitle glow
-        subtitle_glow = self.subtitle_label.graphicsEffect()
-        if subtitle_glow:
-            subtitle_glow.setBlurRadius(8 + 5 * math.sin(self.glow_phase))
-            subtitle_glow.setColor(QColor(255, 255, 255, intensity // 2))
-            
-    def start_shadow_animation(self):
-        """Start shadow pulse animation"""
-        self.shadow_timer.start(150)  # 150ms updates
+        self.glow_step = (self.glow_step + 4) % _SIN_STEPS
+        title_blur, title_alpha, subtitle_blur, subtitle_alpha = _GLOW_FRAMES[self.glow_step]
         
+        # Update title and subtitle glow
+        self.title_glow.set_glow(title_blur, title_alpha)
+        self.subtitle_glow.set_glow(subtitle_blur, subtitle_alpha)
+        self.update()
+            
     def animate_shadow(self):
         """Animate shadow effects"""
-        self.shadow_phase += 0.08
-        blur = int(25 + 10 * math.sin(self.shadow_phase))
-        offset = int(8 + 3 * math.cos(self.shadow_phase))
-        opacity = int(100 + 20 * math.sin(self.shadow_phase * 1.5))
+        self.shadow_step = (self.shadow_step + 3) % len(_SHADOW_FRAMES)
+        blur, offset, color = _SHADOW_FRAMES[self.shadow_step]
         
         self.shadow_effect.setBlurRadius(blur)
         self.shadow_effect.setOffset(0, offset)
-        self.shadow_effect.setColor(QColor(0, 0, 0, opacity))
-        
-    def start_rainbow_animation(self):
-        """Start rainbow border animation"""
-        self.rainbow_timer.start(50)  # 50ms updates for smooth rainbow
+        self.shadow_effect.setColor(color)
         
     def animate_rainbow_border(self):
         """Animate rainbow border effect"""
-        self.rainbow_phase += 0.05
-        hue = int((self.rainbow_phase * 360) % 360)
-        
-        # Create rainbow gradient
-        gradient = QConicalGradient(375, 120, 0)  # Center of banner
-        for i in range(6):
-            angle = (i * 60 + self.rainbow_phase * 360) % 360
-            color = QColor.fromHsv(int(angle) % 360, 255, 255, 150)
-            gradient.setColorAt(i / 5.0, color)
-            
+        self.rainbow_hue = (self.rainbow_hue + _RAINBOW_HUE_STEP) % 360
+        
         # Update border color
-        border_color = QColor.fromHsv(hue, 255, 255, 200)
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(37, 99, 235, 0.95),
-                    stop:0.2 rgba(59, 130, 246, 0.9),
-                    stop:0.4 rgba(5, 150, 105, 0.88),
-                    stop:0.6 rgba(16, 185, 129, 0.85),
-                    stop:0.8 rgba(217, 119, 6, 0.82),
-                    stop:1 rgba(37, 99, 235, 0.75));
-                border-radius: 25px;
-                border: 3px solid {border_color.name()};
-                outline: none;
-            }}
-        """)
-        
-    def start_border_animation(self):
-        """Start border animation"""
-        self.border_timer.start(200)  # 200ms updates
+        self._border_color = _HUE_COLORS[self.rainbow_hue]
+        self.update()
         
     def animate_border(self):
         """Animate border effects"""
-        self.border_phase += 0.1
-        # Add subtle pulsing effect to border radius
-        radius = int(22 + 3 * math.sin(self.border_phase))
-        self.setStyleSheet(f"""
-            QWidget {{
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                    stop:0 rgba(37, 99, 235, 0.95),
-                    stop:0.2 rgba(59, 130, 246, 0.9),
-                    stop:0.4 rgba(5, 150, 105, 0.88),
-                    stop:0.6 rgba(16, 185, 129, 0.85),
-                    stop:0.8 rgba(217, 119, 6, 0.82),
-                    stop:1 rgba(37, 99, 235, 0.75));
-                border-radius: {radius}px;
-                border: 3px solid rgba(255, 255, 255, 0.3);
-                outline: none;
-            }}
-        """)
+        self.border_step = (self.border_step + 4) % _SIN_STEPS
+        # Add subtle pulsing effect to border radius; it holds each of its few values for several ticks
+        radius = _BORDER_RADII[self.border_step]
+        if radius != self._border_radius:
+            self._border_radius = radius
+            self.update()
+
+    def start_timer(self, timer, interval):
+        """Start an animation timer now, or when the banner is next shown"""
+        timer.setInterval(interval)
+        if self.isVisible():
+            timer.start()
+        elif timer.start not in self.paused:
+            self.paused.append(timer.start)
+
+    def start_animation(self, animation):
+        """Start an animation now, or when the banner is next shown"""
+        if self.isVisible():
+            animation.start()
+        elif animation.start not in self.paused:
+            self.paused.append(animation.start)
 
     def stop_animations(self):
         """Stop all animations"""
-        if self.dot_timer.isActive():
-            self.dot_timer.stop()
-        if self.title_timer.isActive():
-            self.title_timer.stop()
-        if self.subtitle_timer.isActive():
-            self.subtitle_timer.stop()
-        if self.glow_timer.isActive():
-            self.glow_timer.stop()
-        if self.shadow_timer.isActive():
-            self.shadow_timer.stop()
-        if self.rainbow_timer.isActive():
-            self.rainbow_timer.stop()
-        if self.border_timer.isActive():
-            self.border_timer.stop()
+        self.paused = []
+        if self.loop_timer.isActive():
+            self.loop_timer.stop()
+        self.title_typewriter.stop()
+        self.subtitle_typewriter.stop()
             
+    def paintEvent(self, event):
+        """Paint the rounded gradient background and the animated border"""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = QRectF(self.rect())
+        radius = self._border_radius
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._bg_gradient)
+        painter.drawRoundedRect(rect, radius, radius)
+        # Stroke along the middle of the border band, inside the widget rect
+        inset = _BANNER_BORDER_WIDTH / 2
+        painter.setPen(QPen(self._border_color, _BANNER_BORDER_WIDTH))
+        painter.setBrush(Qt.NoBrush)
+        painter.drawRoundedRect(rect.adjusted(inset, inset, -inset, -inset), radius - inset, radius - inset)
+        # The labels paint their text over these
+        self.title_glow.paint(painter)
+        self.subtitle_glow.paint(painter)
+        painter.end()
+        
     def showEvent(self, event):
-        """Handle show event to ensure proper positioning"""
+        """Resume the animations paused when the banner was hidden"""
         super().showEvent(event)
-        # Ensure the widget is properly sized when shown
-        self.setFixedSize(720, 180)
-        self.updateGeometry()
+        for resume in self.paused:
+            resume()
+        self.paused = []
+        
+    def hideEvent(self, event):
+        """Pause the running animations while the banner is not visible"""
+        super().hideEvent(event)
+        if self.loop_timer.isActive():
+            self.loop_timer.stop()
+            self.paused.append(self.loop_timer.start)
+        for typewriter in (self.title_typewriter, self.subtitle_typewriter):
+            if typewriter.state() == QAbstractAnimation.Running:
+                typewriter.pause()
+                self.paused.append(typewriter.resume)
+        
+    def sizeHint(self):
+        """The fixed banner size, without asking the layout"""
+        return _BANNER_SIZE
+        
+    def minimumSizeHint(self):
+        """The fixed banner size, without asking the layout"""
+        return _BANNER_SIZE
         
     def resizeEvent(self, event):
         """Handle resize event to maintain fixed size"""
         super().resizeEvent(event)
         # Ensure banner maintains its fixed size
-        if self.size() != self.sizeHint():
-            self.setFixedSize(720, 180)
+        if self.size() != _BANNER_SIZE:
+            self.setFixedSize(_BANNER_SIZE)